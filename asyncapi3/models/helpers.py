@@ -7,6 +7,14 @@ from typing import Any
 from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 
+# Compiled once at import: patterned keys are validated for every key of every
+# patterned object, which makes this a hot path for large specifications.
+PATTERNED_KEY_PATTERN = re.compile(r"^[A-Za-z0-9_\-]+$")
+# Email regex pattern that rejects consecutive dots
+EMAIL_PATTERN = re.compile(
+    r"^(?!.*\.\.)[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+)
+
 
 def is_null(value: Any) -> bool:
     """
@@ -29,9 +37,8 @@ def validate_patterned_key(key: str | Any, object_name: str = "object") -> None:
         ValueError: If the key does not match the required pattern.
         TypeError: If the key is not a string.
     """
-    pattern = re.compile(r"^[A-Za-z0-9_\-]+$")
     try:
-        if not pattern.match(key):
+        if not PATTERNED_KEY_PATTERN.match(key):
             raise ValueError(
                 f"Field '{key}' does not match patterned object key pattern. "
                 "Keys must contain letters, digits, hyphens, and underscores."
@@ -52,9 +59,7 @@ class EmailStr(str):
     @staticmethod
     def _validate_email(value: str) -> str:
         """Validate email format and return EmailStr instance."""
-        # Email regex pattern that rejects consecutive dots
-        pattern = r"^(?!.*\.\.)[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(pattern, value):
+        if not EMAIL_PATTERN.match(value):
             raise ValueError("Invalid email format")
         return value
 
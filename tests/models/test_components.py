@@ -1,5 +1,6 @@
 """Tests for components model."""
 
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -39,6 +40,10 @@ from asyncapi3.models.schema import MultiFormatSchema, Schema
 from asyncapi3.models.security import CorrelationID, SecurityScheme
 from asyncapi3.models.server import Server, ServerVariable
 
+COMPONENTS_ALL_SECTIONS_JSON = (
+    Path(__file__).parent.parent / "fixtures" / "components" / "all_sections.json"
+)
+
 
 # Components Validation Test Cases
 def case_components_empty() -> str:
@@ -2713,80 +2718,9 @@ class TestComponents:
 
     def test_components_with_all_sections_validation(self) -> None:
         """Test Components with all sections validation."""
-
-        yaml_data = """
-        schemas:
-          User:
-            type: object
-        servers:
-          production:
-            host: kafka.in.mycompany.com:9092
-            protocol: kafka
-        channels:
-          userChannel:
-            address: user/signedup
-        operations:
-          sendUserSignup:
-            action: send
-            channel:
-              $ref: '#/channels/userChannel'
-        messages:
-          UserSignedUp:
-            payload:
-              type: object
-        securitySchemes:
-          apiKey:
-            type: apiKey
-            in: user
-            name: api_key
-        serverVariables:
-          port:
-            default: '1883'
-        parameters:
-          userId:
-            description: Id of the user.
-        correlationIds:
-          default:
-            location: $message.header#/correlationId
-        replies:
-          userReply:
-            address:
-              location: $message.header#/replyTo
-        replyAddresses:
-          userReplyAddress:
-            location: $message.header#/replyTo
-        externalDocs:
-          infoDocs:
-            url: https://example.com
-        tags:
-          user:
-            name: user
-        operationTraits:
-          kafka:
-            bindings:
-              http:
-                method: POST
-        messageTraits:
-          commonHeaders:
-            contentType: application/json
-        serverBindings:
-          http:
-            http: {}
-        channelBindings:
-          http:
-            http: {}
-        operationBindings:
-          http:
-            http:
-              method: POST
-        messageBindings:
-          http:
-            http:
-              headers:
-                type: object
-        """
-        data = yaml.safe_load(yaml_data)
-        components = Components.model_validate(data)
+        components = Components.model_validate_json(
+            COMPONENTS_ALL_SECTIONS_JSON.read_text()
+        )
 
         assert components.schemas is not None
         assert components.servers is not None
@@ -1,50 +1,85 @@
 """Tests for message models."""
 
+import re
+
+from collections.abc import Callable, Mapping
+from functools import cache
+from types import MappingProxyType
 from typing import Any
 
 import pytest
-import yaml
 
+from pydantic import TypeAdapter
 from pytest_cases import parametrize_with_cases
 
 from asyncapi3.models.base import Reference
 from asyncapi3.models.message import Message, MessageExample, Messages, MessageTrait
 from asyncapi3.models.schema import Schema
+from tests.utils import load_yaml
+
+MESSAGE_EXAMPLE_ADAPTER = TypeAdapter(MessageExample)
+MESSAGE_EXAMPLE_LIST_ADAPTER = TypeAdapter(list[MessageExample])
+MESSAGE_TRAIT_ADAPTER = TypeAdapter(MessageTrait)
+MESSAGE_ADAPTER = TypeAdapter(Message)
+NO_HEADERS_OR_PAYLOAD_ERROR_PATTERN = re.compile(
+    "MessageExample MUST contain either headers and/or payload fields"
+)
+
+# Leaf schemas shared by serialization cases; tests must not mutate them
+STRING_SCHEMA = Schema.model_construct(type="string")
+EMAIL_STRING_SCHEMA = Schema.model_construct(type="string", format="email")
+OBJECT_SCHEMA = Schema.model_construct(type="object")
+
+# Canonical messages shared by serialization cases and the Messages fixture
+USER_SIGNED_UP = Message.model_construct(
+    payload=Schema.model_construct(
+        type="object",
+        properties={"displayName": STRING_SCHEMA, "email": EMAIL_STRING_SCHEMA},
+    ),
+)
+USER_LOGGED_OUT = Message.model_construct(
+    payload=Schema.model_construct(
+        type="object",
+        properties={"userId": STRING_SCHEMA},
+    ),
+)
 
 
 # MessageExample Validation Test Cases
-def case_message_example_basic() -> str:
+def case_message_example_basic() -> dict[str, Any]:
     """MessageExample with headers and payload."""
-    return """
-    headers:
-      correlationId: my-correlation-id
-      applicationInstanceId: myInstanceId
-    payload:
-      user:
-        someUserKey: someUserValue
-    """
+    return {
+        "headers": {
+            "correlationId": "my-correlation-id",
+            "applicationInstanceId": "myInstanceId",
+        },
+        "payload": {"user": {"someUserKey": "someUserValue"}},
+    }
 
 
-def case_message_example_full() -> str:
+def case_message_example_full() -> dict[str, Any]:
     """MessageExample with all fields."""
-    return """
-    name: SimpleSignup
-    summary: A simple UserSignup example message
-    headers:
-      correlationId: my-correlation-id
-      applicationInstanceId: myInstanceId
-    payload:
-      user:
-        someUserKey: someUserValue
-      signup:
-        someSignupKey: someSignupValue
-    """
+    return {
+        "name": "SimpleSignup",
+        "summary": "A simple UserSignup example message",
+        "headers": {
+            "correlationId": "my-correlation-id",
+            "applicationInstanceId": "myInstanceId",
+        },
+        "payload": {
+            "user": {"someUserKey": "someUserValue"},
+            "signup": {"someSignupKey": "someSignupValue"},
+        },
+    }
 
 
 # MessageExample Serialization Test Cases
-def case_message_example_serialization_basic() -> tuple[MessageExample, dict]:
+@cache
+def case_message_example_serialization_basic() -> tuple[
+    MessageExample, Mapping[str, Any]
+]:
     """MessageExample serialization with headers and payload."""
-    message_example = MessageExample(
+    message_example = MessageExample.model_construct(
         headers={
             "correlationId": "my-correlation-id",
             "applicationInstanceId": "myInstanceId",
@@ -58,12 +93,15 @@ def case_message_example_serialization_basic() -> tuple[MessageExample, dict]:
         },
         "payload": {"user": {"someUserKey": "someUserValue"}},
     }
-    return message_example, expected
+    return message_example, MappingProxyType(expected)
 
 
-def case_message_example_serialization_full() -> tuple[MessageExample, dict]:
+@cache
+def case_message_example_serialization_full() -> tuple[
+    MessageExample, Mapping[str, Any]
+]:
     """MessageExample serialization with all fields."""
-    message_example = MessageExample(
+    message_example = MessageExample.model_construct(
         name="SimpleSignup",
         summary="A simple UserSignup example message",
         headers={
@@ -87,77 +125,85 @@ def case_message_example_serialization_full() -> tuple[MessageExample, dict]:
             "signup": {"someSignupKey": "someSignupValue"},
         },
     }
-    return message_example, expected
+    return message_example, MappingProxyType(expected)
 
 
-def case_message_example_serialization_headers_only() -> tuple[MessageExample, dict]:
+@cache
+def case_message_example_serialization_headers_only() -> tuple[
+    MessageExample, Mapping[str, Any]
+]:
     """MessageExample serialization with headers only."""
-    message_example = MessageExample(
+    message_example = MessageExample.model_construct(
         headers={"correlationId": "my-correlation-id"},
     )
     expected: dict[str, Any] = {
         "headers": {"correlationId": "my-correlation-id"},
     }
-    return message_example, expected
+    return message_example, MappingProxyType(expected)
 
 
-def case_message_example_serialization_payload_only() -> tuple[MessageExample, dict]:
+@cache
+def case_message_example_serialization_payload_only() -> tuple[
+    MessageExample, Mapping[str, Any]
+]:
     """MessageExample serialization with payload only."""
-    message_example = MessageExample(
+    message_example = MessageExample.model_construct(
         payload={"user": {"someUserKey": "someUserValue"}},
     )
     expected: dict[str, Any] = {
         "payload": {"user": {"someUserKey": "someUserValue"}},
     }
-    return message_example, expected
+    return message_example, MappingProxyType(expected)
 
 
 # MessageTrait Validation Test Cases
-def case_message_trait_basic() -> str:
+def case_message_trait_basic() -> dict[str, Any]:
     """MessageTrait with contentType only."""
-    return """
-    contentType: application/json
-    """
+    return {"contentType": "application/json"}
 
 
-def case_message_trait_full() -> str:
+def case_message_trait_full() -> dict[str, Any]:
     """MessageTrait with multiple fields."""
-    return """
-    contentType: application/json
-    name: CommonMessage
-    title: Common Message
-    summary: Common message trait
-    description: A common message trait
-    headers:
-      type: object
-      properties:
-        correlationId:
-          type: string
-    """
+    return {
+        "contentType": "application/json",
+        "name": "CommonMessage",
+        "title": "Common Message",
+        "summary": "Common message trait",
+        "description": "A common message trait",
+        "headers": {
+            "type": "object",
+            "properties": {"correlationId": {"type": "string"}},
+        },
+    }
 
 
 # MessageTrait Serialization Test Cases
-def case_message_trait_serialization_empty() -> tuple[MessageTrait, dict]:
+@cache
+def case_message_trait_serialization_empty() -> tuple[MessageTrait, Mapping[str, Any]]:
     """MessageTrait serialization empty."""
-    message_trait = MessageTrait()
+    message_trait = MessageTrait.model_construct()
     expected: dict[str, Any] = {}
-    return message_trait, expected
+    return message_trait, MappingProxyType(expected)
 
 
-def case_message_trait_serialization_basic() -> tuple[MessageTrait, dict]:
+@cache
+def case_message_trait_serialization_basic() -> tuple[MessageTrait, Mapping[str, Any]]:
     """MessageTrait serialization with contentType only."""
-    message_trait = MessageTrait(content_type="application/json")
+    message_trait = MessageTrait.model_construct(content_type="application/json")
     expected: dict[str, Any] = {"contentType": "application/json"}
-    return message_trait, expected
+    return message_trait, MappingProxyType(expected)
 
 
-def case_message_trait_serialization_with_headers() -> tuple[MessageTrait, dict]:
+@cache
+def case_message_trait_serialization_with_headers() -> tuple[
+    MessageTrait, Mapping[str, Any]
+]:
     """MessageTrait serialization with headers Schema."""
-    message_trait = MessageTrait(
+    message_trait = MessageTrait.model_construct(
         content_type="application/json",
-        headers=Schema(
+        headers=Schema.model_construct(
             type="object",
-            properties={"correlationId": Schema(type="string")},
+            properties={"correlationId": STRING_SCHEMA},
         ),
     )
     expected: dict[str, Any] = {
@@ -171,79 +217,73 @@ def case_message_trait_serialization_with_headers() -> tuple[MessageTrait, dict]
             },
         },
     }
-    return message_trait, expected
+    return message_trait, MappingProxyType(expected)
 
 
 # Message Validation Test Cases
-def case_message_basic() -> str:
+def case_message_basic() -> dict[str, Any]:
     """Message with payload only."""
-    return """
-    payload:
-      type: object
-      properties:
-        displayName:
-          type: string
-        email:
-          type: string
-          format: email
-    """
-
-
-def case_message_full() -> str:
+    return {
+        "payload": {
+            "type": "object",
+            "properties": {
+                "displayName": {"type": "string"},
+                "email": {"type": "string", "format": "email"},
+            },
+        }
+    }
+
+
+def case_message_full() -> dict[str, Any]:
     """Message with all fields."""
-    return """
-    name: UserSignup
-    title: User signup
-    summary: Action to sign a user up.
-    description: A longer description
-    contentType: application/json
-    tags:
-      - name: user
-      - name: signup
-    headers:
-      type: object
-      properties:
-        correlationId:
-          description: Correlation ID set by application
-          type: string
-    payload:
-      type: object
-      properties:
-        user:
-          $ref: '#/components/schemas/userCreate'
-    correlationId:
-      description: Default Correlation ID
-      location: $message.header#/correlationId
-    examples:
-      - name: SimpleSignup
-        summary: A simple UserSignup example message
-        headers:
-          correlationId: my-correlation-id
-        payload:
-          user:
-            someUserKey: someUserValue
-    """
+    return {
+        "name": "UserSignup",
+        "title": "User signup",
+        "summary": "Action to sign a user up.",
+        "description": "A longer description",
+        "contentType": "application/json",
+        "tags": [{"name": "user"}, {"name": "signup"}],
+        "headers": {
+            "type": "object",
+            "properties": {
+                "correlationId": {
+                    "description": "Correlation ID set by application",
+                    "type": "string",
+                }
+            },
+        },
+        "payload": {
+            "type": "object",
+            "properties": {"user": {"$ref": "#/components/schemas/userCreate"}},
+        },
+        "correlationId": {
+            "description": "Default Correlation ID",
+            "location": "$message.header#/correlationId",
+        },
+        "examples": [
+            {
+                "name": "SimpleSignup",
+                "summary": "A simple UserSignup example message",
+                "headers": {"correlationId": "my-correlation-id"},
+                "payload": {"user": {"someUserKey": "someUserValue"}},
+            }
+        ],
+    }
 
 
 # Message Serialization Test Cases
-def case_message_serialization_empty() -> tuple[Message, dict]:
+@cache
+def case_message_serialization_empty() -> tuple[Message, Mapping[str, Any]]:
     """Message serialization empty."""
-    message = Message()
+    message = Message.model_construct()
     expected: dict[str, Any] = {}
-    return message, expected
+    return message, MappingProxyType(expected)
 
 
-def case_message_serialization_basic() -> tuple[Message, dict]:
+@cache
+def case_message_serialization_basic() -> tuple[Message, Mapping[str, Any]]:
     """Message serialization with payload only."""
-    message = Message(
-        payload=Schema(
-            type="object",
-            properties={
-                "displayName": Schema(type="string"),
-                "email": Schema(type="string", format="email"),
-            },
-        ),
-    )
+    message = USER_SIGNED_UP
     expected: dict[str, Any] = {
         "payload": {
             "type": "object",
@@ -253,28 +293,32 @@ def case_message_serialization_basic() -> tuple[Message, dict]:
             },
         },
     }
-    return message, expected
+    return message, MappingProxyType(expected)
 
 
-def case_message_serialization_with_reference_payload() -> tuple[Message, dict]:
+@cache
+def case_message_serialization_with_reference_payload() -> tuple[
+    Message, Mapping[str, Any]
+]:
     """Message serialization with payload as Reference."""
-    message = Message(
-        payload=Reference(ref="#/components/schemas/userCreate"),
+    message = Message.model_construct(
+        payload=Reference.model_construct(ref="#/components/schemas/userCreate"),
     )
     expected: dict[str, Any] = {
         "payload": {
             "$ref": "#/components/schemas/userCreate",
         },
     }
-    return message, expected
+    return message, MappingProxyType(expected)
 
 
-def case_message_serialization_with_examples() -> tuple[Message, dict]:
+@cache
+def case_message_serialization_with_examples() -> tuple[Message, Mapping[str, Any]]:
     """Message serialization with examples."""
-    message = Message(
-        payload=Schema(type="object"),
+    message = Message.model_construct(
+        payload=OBJECT_SCHEMA,
         examples=[
-            MessageExample(
+            MessageExample.model_construct(
                 name="SimpleSignup",
                 summary="A simple UserSignup example message",
                 headers={"correlationId": "my-correlation-id"},
@@ -293,14 +337,17 @@ def case_message_serialization_with_examples() -> tuple[Message, dict]:
             },
         ],
     }
-    return message, expected
+    return message, MappingProxyType(expected)
 
 
-def case_message_serialization_with_traits() -> tuple[Message, dict]:
+@cache
+def case_message_serialization_with_traits() -> tuple[Message, Mapping[str, Any]]:
     """Message serialization with traits."""
-    message = Message(
-        payload=Schema(type="object"),
-        traits=[Reference(ref="#/components/messageTraits/commonHeaders")],
+    message = Message.model_construct(
+        payload=OBJECT_SCHEMA,
+        traits=[
+            Reference.model_construct(ref="#/components/messageTraits/commonHeaders")
+        ],
     )
     expected: dict[str, Any] = {
         "payload": {"type": "object"},
@@ -310,113 +357,101 @@ def case_message_serialization_with_traits() -> tuple[Message, dict]:
             },
         ],
     }
-    return message, expected
+    return message, MappingProxyType(expected)
 
 
 # Messages Validation Test Cases
-def case_messages_basic() -> str:
+def case_messages_basic() -> dict[str, Any]:
     """Messages with basic message objects."""
-    return """
-    messages:
-      UserSignedUp:
-        payload:
-          type: object
-          properties:
-            displayName:
-              type: string
-            email:
-              type: string
-              format: email
-      UserLoggedOut:
-        payload:
-          type: object
-          properties:
-            userId:
-              type: string
-    """
+    return {
+        "UserSignedUp": {
+            "payload": {
+                "type": "object",
+                "properties": {
+                    "displayName": {"type": "string"},
+                    "email": {"type": "string", "format": "email"},
+                },
+            }
+        },
+        "UserLoggedOut": {
+            "payload": {
+                "type": "object",
+                "properties": {"userId": {"type": "string"}},
+            }
+        },
+    }
 
 
-def case_messages_with_references() -> str:
+def case_messages_with_references() -> dict[str, Any]:
     """Messages with references."""
-    return """
-    messages:
-      UserSignedUp:
-        $ref: '#/components/messages/UserSignedUp'
-      UserLoggedOut:
-        $ref: '#/components/messages/UserLoggedOut'
-    """
+    return {
+        "UserSignedUp": {"$ref": "#/components/messages/UserSignedUp"},
+        "UserLoggedOut": {"$ref": "#/components/messages/UserLoggedOut"},
+    }
 
 
 # Messages Validation Error Test Cases
-def case_messages_invalid_key_spaces() -> tuple[str, str]:
+@cache
+def case_messages_invalid_key_spaces() -> tuple[dict[str, Any], re.Pattern[str]]:
     """Messages with key containing spaces - should fail validation."""
-    yaml_data = """
-    messages:
-      user signed up:
-        payload:
-          type: object
-    """
-    expected_error = "Field 'user signed up' does not match patterned object key pattern. Keys must contain letters, digits, hyphens, and underscores."
-    return yaml_data, expected_error
+    data = {"user signed up": {"payload": {"type": "object"}}}
+    expected_error = re.compile(
+        re.escape(
+            "Field 'user signed up' does not match patterned object key pattern. Keys must contain letters, digits, hyphens, and underscores."
+        )
+    )
+    return data, expected_error
 
 
-def case_messages_invalid_key_special_chars() -> tuple[str, str]:
+@cache
+def case_messages_invalid_key_special_chars() -> tuple[dict[str, Any], re.Pattern[str]]:
     """Messages with key containing special characters - should fail validation."""
-    yaml_data = """
-    messages:
-      user@signed@up:
-        payload:
-          type: object
-    """
-    expected_error = "Field 'user@signed@up' does not match patterned object key pattern. Keys must contain letters, digits, hyphens, and underscores."
-    return yaml_data, expected_error
+    data = {"user@signed@up": {"payload": {"type": "object"}}}
+    expected_error = re.compile(
+        re.escape(
+            "Field 'user@signed@up' does not match patterned object key pattern. Keys must contain letters, digits, hyphens, and underscores."
+        )
+    )
+    return data, expected_error
 
 
-def case_messages_invalid_key_parentheses() -> tuple[str, str]:
+@cache
+def case_messages_invalid_key_parentheses() -> tuple[dict[str, Any], re.Pattern[str]]:
     """Messages with key containing parentheses - should fail validation."""
-    yaml_data = """
-    messages:
-      user(signed)up:
-        payload:
-          type: object
-    """
-    expected_error = "Field 'user\\(signed\\)up' does not match patterned object key pattern. Keys must contain letters, digits, hyphens, and underscores."
-    return yaml_data, expected_error
+    data = {"user(signed)up": {"payload": {"type": "object"}}}
+    expected_error = re.compile(
+        re.escape(
+            "Field 'user(signed)up' does not match patterned object key pattern. Keys must contain letters, digits, hyphens, and underscores."
+        )
+    )
+    return data, expected_error
+
+
+@pytest.fixture(scope="module")
+def sample_messages() -> tuple[Messages, Message, Message]:
+    """Messages container with UserSignedUp and UserLoggedOut, built once."""
+    data: dict[str, Message | Reference] = {
+        "UserSignedUp": USER_SIGNED_UP,
+        "UserLoggedOut": USER_LOGGED_OUT,
+    }
+    return Messages.model_construct(root=data), USER_SIGNED_UP, USER_LOGGED_OUT
 
 
 class TestMessageExample:
     """Tests for MessageExample model."""
 
-    @parametrize_with_cases(
-        "yaml_data",
-        cases=[case_message_example_basic, case_message_example_full],
-    )
-    def test_message_example_validation(self, yaml_data: str) -> None:
-        """Test MessageExample model validation."""
-        data = yaml.safe_load(yaml_data)
-        message_example = MessageExample.model_validate(data)
-        assert message_example is not None
-        assert (
-            message_example.headers is not None or message_example.payload is not None
+    def test_message_example_serialization_batch(self) -> None:
+        """Test MessageExample serialization of all cases in a single dump call."""
+        cases = [
+            case_message_example_serialization_basic(),
+            case_message_example_serialization_full(),
+            case_message_example_serialization_headers_only(),
+            case_message_example_serialization_payload_only(),
+        ]
+        dumped = MESSAGE_EXAMPLE_LIST_ADAPTER.dump_python(
+            [message_example for message_example, _ in cases]
         )
-
-    @parametrize_with_cases(
-        "message_example,expected",
-        cases=[
-            case_message_example_serialization_basic,
-            case_message_example_serialization_full,
-            case_message_example_serialization_headers_only,
-            case_message_example_serialization_payload_only,
-        ],
-    )
-    def test_message_example_serialization(
-        self,
-        message_example: MessageExample,
-        expected: dict,
-    ) -> None:
-        """Test MessageExample serialization."""
-        dumped = message_example.model_dump()
-        assert dumped == expected
+        assert dumped == [expected for _, expected in cases]
 
     def test_message_example_validation_error_no_headers_or_payload(self) -> None:
         """Test MessageExample validation error when neither headers nor payload are provided."""
@@ -424,29 +459,14 @@ class TestMessageExample:
         name: InvalidExample
         summary: This should fail validation
         """
-        data = yaml.safe_load(yaml_data)
-        with pytest.raises(
-            ValueError,
-            match="MessageExample MUST contain either headers and/or payload fields",
-        ):
-            MessageExample.model_validate(data)
+        data = load_yaml(yaml_data)
+        with pytest.raises(ValueError, match=NO_HEADERS_OR_PAYLOAD_ERROR_PATTERN):
+            MESSAGE_EXAMPLE_ADAPTER.validate_python(data)
 
 
 class TestMessageTrait:
     """Tests for MessageTrait model."""
 
-    @parametrize_with_cases(
-        "yaml_data",
-        cases=[case_message_trait_basic, case_message_trait_full],
-    )
-    def test_message_trait_validation(self, yaml_data: str) -> None:
-        """Test MessageTrait model validation."""
-        data = yaml.safe_load(yaml_data)
-        message_trait = MessageTrait.model_validate(data)
-        assert message_trait is not None
-        if "contentType" in data:
-            assert message_trait.content_type == data["contentType"]
-
     @parametrize_with_cases(
         "message_trait,expected",
         cases=[
@@ -458,7 +478,7 @@ class TestMessageTrait:
     def test_message_trait_serialization(
         self,
         message_trait: MessageTrait,
-        expected: dict,
+        expected: Mapping[str, Any],
     ) -> None:
         """Test MessageTrait serialization."""
         dumped = message_trait.model_dump()
@@ -474,8 +494,8 @@ class TestMessageTrait:
             correlationId:
               type: string
         """
-        data = yaml.safe_load(yaml_data)
-        message_trait = MessageTrait.model_validate(data)
+        data = load_yaml(yaml_data)
+        message_trait = MESSAGE_TRAIT_ADAPTER.validate_python(data)
 
         assert message_trait.content_type == "application/json"
         assert message_trait.headers is not None
@@ -486,18 +506,6 @@ class TestMessageTrait:
 class TestMessage:
     """Tests for Message model."""
 
-    @parametrize_with_cases(
-        "yaml_data",
-        cases=[case_message_basic, case_message_full],
-    )
-    def test_message_validation(self, yaml_data: str) -> None:
-        """Test Message model validation."""
-        data = yaml.safe_load(yaml_data)
-        message = Message.model_validate(data)
-        assert message is not None
-        if "payload" in data:
-            assert message.payload is not None
-
     @parametrize_with_cases(
         "message,expected",
         cases=[
@@ -508,7 +516,9 @@ class TestMessage:
             case_message_serialization_with_traits,
         ],
     )
-    def test_message_serialization(self, message: Message, expected: dict) -> None:
+    def test_message_serialization(
+        self, message: Message, expected: Mapping[str, Any]
+    ) -> None:
         """Test Message serialization."""
         dumped = message.model_dump()
         assert dumped == expected
@@ -527,14 +537,12 @@ class TestMessage:
               user:
                 someUserKey: someUserValue
         """
-        data = yaml.safe_load(yaml_data)
-        message = Message.model_validate(data)
+        data = load_yaml(yaml_data)
+        message = MESSAGE_ADAPTER.validate_python(data)
 
-        assert message.examples is not None
-        assert len(message.examples) == 1
-        assert isinstance(message.examples[0], MessageExample)
-        assert message.examples[0].name == "SimpleSignup"
-        assert message.examples[0].summary == "A simple UserSignup example message"
+        assert [(e.name, e.summary) for e in message.examples or ()] == [
+            ("SimpleSignup", "A simple UserSignup example message")
+        ]
 
     def test_message_with_traits_validation(self) -> None:
         """Test Message with traits validation."""
@@ -544,13 +552,12 @@ class TestMessage:
         traits:
           - $ref: '#/components/messageTraits/commonHeaders'
         """
-        data = yaml.safe_load(yaml_data)
-        message = Message.model_validate(data)
+        data = load_yaml(yaml_data)
+        message = MESSAGE_ADAPTER.validate_python(data)
 
-        assert message.traits is not None
-        assert len(message.traits) == 1
-        assert isinstance(message.traits[0], Reference)
-        assert message.traits[0].ref == "#/components/messageTraits/commonHeaders"
+        assert message.traits == [
+            Reference(ref="#/components/messageTraits/commonHeaders")
+        ]
 
     def test_message_with_reference_payload_validation(self) -> None:
         """Test Message with payload as Reference validation."""
@@ -558,31 +565,28 @@ class TestMessage:
         payload:
           $ref: '#/components/schemas/userCreate'
         """
-        data = yaml.safe_load(yaml_data)
-        message = Message.model_validate(data)
+        data = load_yaml(yaml_data)
+        message = MESSAGE_ADAPTER.validate_python(data)
 
-        assert message.payload is not None
-        assert isinstance(message.payload, Reference)
-        assert message.payload.ref == "#/components/schemas/userCreate"
+        assert message.payload == Reference(ref="#/components/schemas/userCreate")
 
 
 class TestMessages:
     """Tests for Messages model."""
 
     @parametrize_with_cases(
-        "yaml_data",
+        "data",
         cases=[case_messages_basic, case_messages_with_references],
     )
-    def test_messages_validation(self, yaml_data: str) -> None:
+    def test_messages_validation(self, data: dict[str, Any]) -> None:
         """Test Messages model validation."""
-        data = yaml.safe_load(yaml_data)
-        messages = Messages.model_validate(data["messages"])
+        messages = Messages.model_validate(data)
         assert messages is not None
         assert isinstance(messages.root, dict)
         assert len(messages.root) > 0
 
     @parametrize_with_cases(
-        "yaml_data,expected_error",
+        "data,expected_error",
         cases=[
             case_messages_invalid_key_spaces,
             case_messages_invalid_key_special_chars,
@@ -590,12 +594,11 @@ class TestMessages:
         ],
     )
     def test_messages_validation_errors(
-        self, yaml_data: str, expected_error: str
+        self, data: dict[str, Any], expected_error: re.Pattern[str]
     ) -> None:
         """Test Messages validation errors for invalid field names."""
-        data = yaml.safe_load(yaml_data)
         with pytest.raises(ValueError, match=expected_error):
-            Messages.model_validate(data["messages"])
+            Messages.model_validate(data)
 
     def test_messages_empty_dict_validation(self) -> None:
         """Test Messages with empty dict validation."""
@@ -604,85 +607,44 @@ class TestMessages:
         assert messages.root == {}
         assert len(messages.root) == 0
 
-    def test_messages_iteration(self) -> None:
-        """Test Messages __iter__ method."""
-        user_signed_up = Message(
-            payload=Schema(
-                type="object",
-                properties={
-                    "displayName": Schema(type="string"),
-                    "email": Schema(type="string", format="email"),
-                },
-            ),
-        )
-        user_logged_out = Message(
-            payload=Schema(
-                type="object",
-                properties={"userId": Schema(type="string")},
-            ),
-        )
-
-        data: dict[str, Message | Reference] = {
-            "UserSignedUp": user_signed_up,
-            "UserLoggedOut": user_logged_out,
-        }
-        messages = Messages(root=data)
-
-        keys = list(messages)
-        assert len(keys) == 2
-        assert "UserSignedUp" in keys
-        assert "UserLoggedOut" in keys
-
-    def test_messages_getitem(self) -> None:
-        """Test Messages __getitem__ method."""
-        user_signed_up = Message(
-            payload=Schema(
-                type="object",
-                properties={
-                    "displayName": Schema(type="string"),
-                    "email": Schema(type="string", format="email"),
-                },
-            ),
-        )
-        user_logged_out = Message(
-            payload=Schema(
-                type="object",
-                properties={"userId": Schema(type="string")},
-            ),
-        )
-
-        data: dict[str, Message | Reference] = {
-            "UserSignedUp": user_signed_up,
-            "UserLoggedOut": user_logged_out,
-        }
-        messages = Messages(root=data)
-
-        assert messages["UserSignedUp"] == user_signed_up
-        assert messages["UserLoggedOut"] == user_logged_out
-
-    def test_messages_getattr(self) -> None:
-        """Test Messages __getitem__ method."""
-        user_signed_up = Message(
-            payload=Schema(
-                type="object",
-                properties={
-                    "displayName": Schema(type="string"),
-                    "email": Schema(type="string", format="email"),
-                },
-            ),
-        )
-        user_logged_out = Message(
-            payload=Schema(
-                type="object",
-                properties={"userId": Schema(type="string")},
-            ),
-        )
-
-        data: dict[str, Message | Reference] = {
-            "UserSignedUp": user_signed_up,
-            "UserLoggedOut": user_logged_out,
-        }
-        messages = Messages(root=data)
-
-        assert messages["UserSignedUp"] == user_signed_up
-        assert messages["UserLoggedOut"] == user_logged_out
+    def test_messages_access(
+        self, sample_messages: tuple[Messages, Message, Message]
+    ) -> None:
+        """Test Messages __iter__ and __getitem__ methods."""
+        messages, user_signed_up, user_logged_out = sample_messages
+
+        assert list(messages) == ["UserSignedUp", "UserLoggedOut"]
+        assert messages["UserSignedUp"] is user_signed_up
+        assert messages["UserLoggedOut"] is user_logged_out
+
+
+class TestMessageModelsValidation:
+    """Validation round-trip tests for MessageExample, MessageTrait and Message."""
+
+    @pytest.mark.parametrize(
+        ("adapter", "case"),
+        [
+            (MESSAGE_EXAMPLE_ADAPTER, case_message_example_basic),
+            (MESSAGE_EXAMPLE_ADAPTER, case_message_example_full),
+            (MESSAGE_TRAIT_ADAPTER, case_message_trait_basic),
+            (MESSAGE_TRAIT_ADAPTER, case_message_trait_full),
+            (MESSAGE_ADAPTER, case_message_basic),
+            (MESSAGE_ADAPTER, case_message_full),
+        ],
+        ids=[
+            "message_example_basic",
+            "message_example_full",
+            "message_trait_basic",
+            "message_trait_full",
+            "message_basic",
+            "message_full",
+        ],
+    )
+    def test_validation_roundtrip(
+        self,
+        adapter: TypeAdapter[MessageExample | MessageTrait | Message],
+        case: Callable[[], dict[str, Any]],
+    ) -> None:
+        """Test that validated models dump back to the source data."""
+        data = case()
+        assert adapter.dump_python(adapter.validate_python(data)) == data
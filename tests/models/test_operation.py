@@ -1,10 +1,15 @@
 """Tests for operation models."""
 
+import re
+
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
 from typing import Any
 
 import pytest
-import yaml
 
+from pydantic import TypeAdapter
 from pytest_cases import parametrize_with_cases
 
 from asyncapi3.models.base import Reference
@@ -15,92 +20,117 @@ from asyncapi3.models.operation import (
     Operations,
     OperationTrait,
 )
+from tests.utils import load_yaml
+
+OPERATION_REPLY_ADDRESS_ADAPTER = TypeAdapter(OperationReplyAddress)
+OPERATION_REPLY_ADAPTER = TypeAdapter(OperationReply)
+OPERATION_TRAIT_ADAPTER = TypeAdapter(OperationTrait)
+OPERATION_ADAPTER = TypeAdapter(Operation)
+OPERATION_LIST_ADAPTER = TypeAdapter(list[Operation])
+
+# Channel references shared by cases and module-level objects
+USER_SIGNUP_CHANNEL_REF = Reference(ref="#/channels/userSignup")
+USER_CHANNEL_REF = Reference(ref="#/channels/userChannel")
+
+# Operations container shared by the Operations access tests
+SEND_OPERATION = Operation(action="send", channel=USER_CHANNEL_REF)
+RECEIVE_OPERATION = Operation(action="receive", channel=USER_CHANNEL_REF)
+OPERATIONS = Operations(
+    root={"sendUserSignup": SEND_OPERATION, "receiveUserSignup": RECEIVE_OPERATION}
+)
+
+# Reply sub-objects shared by serialization cases
+REPLY_ADDRESS = OperationReplyAddress.model_construct(
+    location="$message.header#/replyTo"
+)
+REPLY_ADDRESS_FULL = OperationReplyAddress.model_construct(
+    location="$message.header#/replyTo",
+    description="Reply address location",
+)
+REPLY_CHANNEL_REF = Reference.model_construct(ref="#/channels/userSignupReply")
 
 
 # OperationReplyAddress Validation Test Cases
-def case_operation_reply_address_basic() -> str:
+def case_operation_reply_address_basic() -> dict[str, Any]:
     """OperationReplyAddress with location only."""
-    return """
-    location: '$message.header#/replyTo'
-    """
+    return {"location": "$message.header#/replyTo"}
 
 
-def case_operation_reply_address_full() -> str:
+def case_operation_reply_address_full() -> dict[str, Any]:
     """OperationReplyAddress with location and description."""
-    return """
-    location: '$message.header#/replyTo'
-    description: Reply address location
-    """
+    return {
+        "location": "$message.header#/replyTo",
+        "description": "Reply address location",
+    }
 
 
 # OperationReplyAddress Serialization Test Cases
+@cache
 def case_operation_reply_address_serialization_basic() -> tuple[
-    OperationReplyAddress, dict
+    OperationReplyAddress, Mapping[str, Any]
 ]:
     """OperationReplyAddress serialization with location only."""
-    reply_address = OperationReplyAddress(location="$message.header#/replyTo")
+    reply_address = REPLY_ADDRESS
     expected: dict[str, Any] = {"location": "$message.header#/replyTo"}
-    return reply_address, expected
+    return reply_address, MappingProxyType(expected)
 
 
+@cache
 def case_operation_reply_address_serialization_full() -> tuple[
-    OperationReplyAddress, dict
+    OperationReplyAddress, Mapping[str, Any]
 ]:
     """OperationReplyAddress serialization with location and description."""
-    reply_address = OperationReplyAddress(
-        location="$message.header#/replyTo",
-        description="Reply address location",
-    )
+    reply_address = REPLY_ADDRESS_FULL
     expected: dict[str, Any] = {
         "location": "$message.header#/replyTo",
         "description": "Reply address location",
     }
-    return reply_address, expected
+    return reply_address, MappingProxyType(expected)
 
 
 # OperationReply Validation Test Cases
-def case_operation_reply_basic() -> str:
+def case_operation_reply_basic() -> dict[str, Any]:
     """OperationReply with address only."""
-    return """
-    address:
-      location: '$message.header#/replyTo'
-    """
+    return {"address": {"location": "$message.header#/replyTo"}}
 
 
-def case_operation_reply_full() -> str:
+def case_operation_reply_full() -> dict[str, Any]:
     """OperationReply with all fields."""
-    return """
-    address:
-      location: '$message.header#/replyTo'
-      description: Reply address location
-    channel:
-      $ref: '#/channels/userSignupReply'
-    messages:
-      - $ref: '#/channels/userSignupReply/messages/userSignedUpReply'
-    """
+    return {
+        "address": {
+            "location": "$message.header#/replyTo",
+            "description": "Reply address location",
+        },
+        "channel": {"$ref": "#/channels/userSignupReply"},
+        "messages": [{"$ref": "#/channels/userSignupReply/messages/userSignedUpReply"}],
+    }
 
 
 # OperationReply Serialization Test Cases
-def case_operation_reply_serialization_basic() -> tuple[OperationReply, dict]:
+@cache
+def case_operation_reply_serialization_basic() -> tuple[
+    OperationReply, Mapping[str, Any]
+]:
     """OperationReply serialization with address only."""
-    reply = OperationReply(
-        address=OperationReplyAddress(location="$message.header#/replyTo"),
+    reply = OperationReply.model_construct(
+        address=REPLY_ADDRESS,
     )
     expected: dict[str, Any] = {
         "address": {
             "location": "$message.header#/replyTo",
         },
     }
-    return reply, expected
+    return reply, MappingProxyType(expected)
 
 
+@cache
 def case_operation_reply_serialization_with_reference_channel() -> tuple[
-    OperationReply, dict
+    OperationReply, Mapping[str, Any]
 ]:
     """OperationReply serialization with channel as Reference."""
-    reply = OperationReply(
-        address=OperationReplyAddress(location="$message.header#/replyTo"),
-        channel=Reference(ref="#/channels/userSignupReply"),
+    reply = OperationReply.model_construct(
+        address=REPLY_ADDRESS,
+        channel=REPLY_CHANNEL_REF,
     )
     expected: dict[str, Any] = {
         "address": {
@@ -110,19 +140,21 @@ def case_operation_reply_serialization_with_reference_channel() -> tuple[
             "$ref": "#/channels/userSignupReply",
         },
     }
-    return reply, expected
+    return reply, MappingProxyType(expected)
 
 
-def case_operation_reply_serialization_full() -> tuple[OperationReply, dict]:
+@cache
+def case_operation_reply_serialization_full() -> tuple[
+    OperationReply, Mapping[str, Any]
+]:
     """OperationReply serialization with all fields."""
-    reply = OperationReply(
-        address=OperationReplyAddress(
-            location="$message.header#/replyTo",
-            description="Reply address location",
-        ),
-        channel=Reference(ref="#/channels/userSignupReply"),
+    reply = OperationReply.model_construct(
+        address=REPLY_ADDRESS_FULL,
+        channel=REPLY_CHANNEL_REF,
         messages=[
-            Reference(ref="#/channels/userSignupReply/messages/userSignedUpReply"),
+            Reference.model_construct(
+                ref="#/channels/userSignupReply/messages/userSignedUpReply"
+            ),
         ],
     )
     expected: dict[str, Any] = {
@@ -139,82 +171,68 @@ def case_operation_reply_serialization_full() -> tuple[OperationReply, dict]:
             },
         ],
     }
-    return reply, expected
+    return reply, MappingProxyType(expected)
 
 
 # OperationTrait Validation Test Cases
-def case_operation_trait_basic() -> str:
+def case_operation_trait_basic() -> dict[str, Any]:
     """OperationTrait with bindings only."""
-    return """
-    bindings:
-      amqp:
-        ack: false
-    """
+    return {"bindings": {"amqp": {"ack": False}}}
 
 
-def case_operation_trait_full() -> str:
+def case_operation_trait_full() -> dict[str, Any]:
     """OperationTrait with multiple fields."""
-    return """
-    title: User sign up
-    summary: Action to sign a user up.
-    description: A longer description
-    bindings:
-      amqp:
-        ack: false
-    """
+    return {
+        "title": "User sign up",
+        "summary": "Action to sign a user up.",
+        "description": "A longer description",
+        "bindings": {"amqp": {"ack": False}},
+    }
 
 
 # OperationTrait Serialization Test Cases
-def case_operation_trait_serialization_empty() -> tuple[OperationTrait, dict]:
+@cache
+def case_operation_trait_serialization_empty() -> tuple[
+    OperationTrait, Mapping[str, Any]
+]:
     """OperationTrait serialization empty."""
-    trait = OperationTrait()
+    trait = OperationTrait.model_construct()
     expected: dict[str, Any] = {}
-    return trait, expected
+    return trait, MappingProxyType(expected)
 
 
 # Operation Validation Test Cases
-def case_operation_basic() -> str:
+def case_operation_basic() -> dict[str, Any]:
     """Operation with required fields only."""
-    return """
-    action: send
-    channel:
-      $ref: '#/channels/userSignup'
-    """
+    return {"action": "send", "channel": {"$ref": "#/channels/userSignup"}}
 
 
-def case_operation_full() -> str:
+def case_operation_full() -> dict[str, Any]:
     """Operation with all fields."""
-    return """
-    title: User sign up
-    summary: Action to sign a user up.
-    description: A longer description
-    channel:
-      $ref: '#/channels/userSignup'
-    action: send
-    tags:
-      - name: user
-      - name: signup
-    bindings:
-      amqp:
-        ack: false
-    traits:
-      - $ref: '#/components/operationTraits/kafka'
-    messages:
-      - $ref: '#/channels/userSignup/messages/userSignedUp'
-    reply:
-      address:
-        location: '$message.header#/replyTo'
-      channel:
-        $ref: '#/channels/userSignupReply'
-    """
+    return {
+        "title": "User sign up",
+        "summary": "Action to sign a user up.",
+        "description": "A longer description",
+        "channel": {"$ref": "#/channels/userSignup"},
+        "action": "send",
+        "tags": [{"name": "user"}, {"name": "signup"}],
+        "bindings": {"amqp": {"ack": False}},
+        "traits": [{"$ref": "#/components/operationTraits/kafka"}],
+        "messages": [{"$ref": "#/channels/userSignup/messages/userSignedUp"}],
+        "reply": {
+            "address": {"location": "$message.header#/replyTo"},
+            "channel": {"$ref": "#/channels/userSignupReply"},
+        },
+    }
 
 
 # Operation Serialization Test Cases
-def case_operation_serialization_basic() -> tuple[Operation, dict]:
+@cache
+def case_operation_serialization_basic() -> tuple[Operation, Mapping[str, Any]]:
     """Operation serialization with required fields only."""
-    operation = Operation(
+    operation = Operation.model_construct(
         action="send",
-        channel=Reference(ref="#/channels/userSignup"),
+        channel=USER_SIGNUP_CHANNEL_REF,
     )
     expected: dict[str, Any] = {
         "action": "send",
@@ -222,17 +240,18 @@ def case_operation_serialization_basic() -> tuple[Operation, dict]:
             "$ref": "#/channels/userSignup",
         },
     }
-    return operation, expected
+    return operation, MappingProxyType(expected)
 
 
-def case_operation_serialization_with_reply() -> tuple[Operation, dict]:
+@cache
+def case_operation_serialization_with_reply() -> tuple[Operation, Mapping[str, Any]]:
     """Operation serialization with reply."""
-    operation = Operation(
+    operation = Operation.model_construct(
         action="send",
-        channel=Reference(ref="#/channels/userSignup"),
-        reply=OperationReply(
-            address=OperationReplyAddress(location="$message.header#/replyTo"),
-            channel=Reference(ref="#/channels/userSignupReply"),
+        channel=USER_SIGNUP_CHANNEL_REF,
+        reply=OperationReply.model_construct(
+            address=REPLY_ADDRESS,
+            channel=REPLY_CHANNEL_REF,
         ),
     )
     expected: dict[str, Any] = {
@@ -249,16 +268,19 @@ def case_operation_serialization_with_reply() -> tuple[Operation, dict]:
             },
         },
     }
-    return operation, expected
+    return operation, MappingProxyType(expected)
 
 
-def case_operation_serialization_with_messages() -> tuple[Operation, dict]:
+@cache
+def case_operation_serialization_with_messages() -> tuple[Operation, Mapping[str, Any]]:
     """Operation serialization with messages."""
-    operation = Operation(
+    operation = Operation.model_construct(
         action="send",
-        channel=Reference(ref="#/channels/userSignup"),
+        channel=USER_SIGNUP_CHANNEL_REF,
         messages=[
-            Reference(ref="#/channels/userSignup/messages/userSignedUp"),
+            Reference.model_construct(
+                ref="#/channels/userSignup/messages/userSignedUp"
+            ),
         ],
     )
     expected: dict[str, Any] = {
@@ -272,16 +294,17 @@ def case_operation_serialization_with_messages() -> tuple[Operation, dict]:
             },
         ],
     }
-    return operation, expected
+    return operation, MappingProxyType(expected)
 
 
-def case_operation_serialization_with_traits() -> tuple[Operation, dict]:
+@cache
+def case_operation_serialization_with_traits() -> tuple[Operation, Mapping[str, Any]]:
     """Operation serialization with traits."""
-    operation = Operation(
+    operation = Operation.model_construct(
         action="send",
-        channel=Reference(ref="#/channels/userSignup"),
+        channel=USER_SIGNUP_CHANNEL_REF,
         traits=[
-            Reference(ref="#/components/operationTraits/kafka"),
+            Reference.model_construct(ref="#/components/operationTraits/kafka"),
         ],
     )
     expected: dict[str, Any] = {
@@ -295,87 +318,106 @@ def case_operation_serialization_with_traits() -> tuple[Operation, dict]:
             },
         ],
     }
-    return operation, expected
+    return operation, MappingProxyType(expected)
 
 
 # Operations Validation Test Cases
-def case_operations_basic() -> str:
+def case_operations_basic() -> dict[str, Any]:
     """Operations with basic operation objects."""
-    return """
-    operations:
-      sendUserSignup:
-        action: send
-        channel:
-          $ref: '#/channels/userChannel'
-      receiveUserSignup:
-        action: receive
-        channel:
-          $ref: '#/channels/userChannel'
-    """
+    return {
+        "operations": {
+            "sendUserSignup": {
+                "action": "send",
+                "channel": {"$ref": "#/channels/userChannel"},
+            },
+            "receiveUserSignup": {
+                "action": "receive",
+                "channel": {"$ref": "#/channels/userChannel"},
+            },
+        }
+    }
 
 
-def case_operations_with_references() -> str:
+def case_operations_with_references() -> dict[str, Any]:
     """Operations with references."""
-    return """
-    operations:
-      sendUserSignup:
-        $ref: '#/components/operations/sendUserSignup'
-      receiveUserSignup:
-        $ref: '#/components/operations/receiveUserSignup'
-    """
+    return {
+        "operations": {
+            "sendUserSignup": {"$ref": "#/components/operations/sendUserSignup"},
+            "receiveUserSignup": {"$ref": "#/components/operations/receiveUserSignup"},
+        }
+    }
 
 
 # Operations Validation Error Test Cases
-def case_operations_invalid_key_spaces() -> tuple[str, str]:
+@cache
+def case_operations_invalid_key_spaces() -> tuple[dict[str, Any], re.Pattern[str]]:
     """Operations with key containing spaces - should fail validation."""
-    yaml_data = """
-    operations:
-      send user signup:
-        action: send
-        channel:
-          $ref: '#/channels/userChannel'
-    """
-    expected_error = "Field 'send user signup' does not match patterned object key pattern. Keys must contain letters, digits, hyphens, and underscores."
-    return yaml_data, expected_error
+    data = {
+        "operations": {
+            "send user signup": {
+                "action": "send",
+                "channel": {"$ref": "#/channels/userChannel"},
+            }
+        }
+    }
+    expected_error = re.compile(
+        re.escape(
+            "Field 'send user signup' does not match patterned object key pattern. Keys must contain letters, digits, hyphens, and underscores."
+        )
+    )
+    return data, expected_error
 
 
-def case_operations_invalid_key_special_chars() -> tuple[str, str]:
+@cache
+def case_operations_invalid_key_special_chars() -> tuple[
+    dict[str, Any], re.Pattern[str]
+]:
     """Operations with key containing special characters - should fail validation."""
-    yaml_data = """
-    operations:
-      send@user@signup:
-        action: send
-        channel:
-          $ref: '#/channels/userChannel'
-    """
-    expected_error = "Field 'send@user@signup' does not match patterned object key pattern. Keys must contain letters, digits, hyphens, and underscores."
-    return yaml_data, expected_error
+    data = {
+        "operations": {
+            "send@user@signup": {
+                "action": "send",
+                "channel": {"$ref": "#/channels/userChannel"},
+            }
+        }
+    }
+    expected_error = re.compile(
+        re.escape(
+            "Field 'send@user@signup' does not match patterned object key pattern. Keys must contain letters, digits, hyphens, and underscores."
+        )
+    )
+    return data, expected_error
 
 
-def case_operations_invalid_key_parentheses() -> tuple[str, str]:
+@cache
+def case_operations_invalid_key_parentheses() -> tuple[dict[str, Any], re.Pattern[str]]:
     """Operations with key containing parentheses - should fail validation."""
-    yaml_data = """
-    operations:
-      send(user)signup:
-        action: send
-        channel:
-          $ref: '#/channels/userChannel'
-    """
-    expected_error = "Field 'send\\(user\\)signup' does not match patterned object key pattern. Keys must contain letters, digits, hyphens, and underscores."
-    return yaml_data, expected_error
+    data = {
+        "operations": {
+            "send(user)signup": {
+                "action": "send",
+                "channel": {"$ref": "#/channels/userChannel"},
+            }
+        }
+    }
+    expected_error = re.compile(
+        re.escape(
+            "Field 'send(user)signup' does not match patterned object key pattern. Keys must contain letters, digits, hyphens, and underscores."
+        )
+    )
+    return data, expected_error
 
 
 class TestOperationReplyAddress:
     """Tests for OperationReplyAddress model."""
 
     @parametrize_with_cases(
-        "yaml_data",
+        "data",
         cases=[case_operation_reply_address_basic, case_operation_reply_address_full],
     )
-    def test_operation_reply_address_validation(self, yaml_data: str) -> None:
+    def test_operation_reply_address_validation(self, data: dict[str, Any]) -> None:
         """Test OperationReplyAddress model validation."""
-        data = yaml.safe_load(yaml_data)
-        reply_address = OperationReplyAddress.model_validate(data)
+        reply_address = OPERATION_REPLY_ADDRESS_ADAPTER.validate_python(data)
         assert reply_address is not None
         assert reply_address.location == "$message.header#/replyTo"
 
@@ -389,7 +431,7 @@ class TestOperationReplyAddress:
     def test_operation_reply_address_serialization(
         self,
         reply_address: OperationReplyAddress,
-        expected: dict,
+        expected: Mapping[str, Any],
     ) -> None:
         """Test OperationReplyAddress serialization."""
         dumped = reply_address.model_dump()
@@ -400,13 +442,12 @@ class TestOperationReply:
     """Tests for OperationReply model."""
 
     @parametrize_with_cases(
-        "yaml_data",
+        "data",
         cases=[case_operation_reply_basic, case_operation_reply_full],
     )
-    def test_operation_reply_validation(self, yaml_data: str) -> None:
+    def test_operation_reply_validation(self, data: dict[str, Any]) -> None:
         """Test OperationReply model validation."""
-        data = yaml.safe_load(yaml_data)
-        reply = OperationReply.model_validate(data)
+        reply = OPERATION_REPLY_ADAPTER.validate_python(data)
         assert reply is not None
         assert reply.address is not None
 
@@ -421,7 +462,7 @@ class TestOperationReply:
     def test_operation_reply_serialization(
         self,
         reply: OperationReply,
-        expected: dict,
+        expected: Mapping[str, Any],
     ) -> None:
         """Test OperationReply serialization."""
         dumped = reply.model_dump()
@@ -435,25 +476,22 @@ class TestOperationReply:
         channel:
           $ref: '#/channels/userSignupReply'
         """
-        data = yaml.safe_load(yaml_data)
-        reply = OperationReply.model_validate(data)
+        data = load_yaml(yaml_data)
+        reply = OPERATION_REPLY_ADAPTER.validate_python(data)
 
-        assert reply.channel is not None
-        assert isinstance(reply.channel, Reference)
-        assert reply.channel.ref == "#/channels/userSignupReply"
+        assert reply.model_dump() == data
 
 
 class TestOperationTrait:
     """Tests for OperationTrait model."""
 
     @parametrize_with_cases(
-        "yaml_data",
+        "data",
         cases=[case_operation_trait_basic, case_operation_trait_full],
     )
-    def test_operation_trait_validation(self, yaml_data: str) -> None:
+    def test_operation_trait_validation(self, data: dict[str, Any]) -> None:
         """Test OperationTrait model validation."""
-        data = yaml.safe_load(yaml_data)
-        trait = OperationTrait.model_validate(data)
+        trait = OPERATION_TRAIT_ADAPTER.validate_python(data)
         assert trait is not None
 
     @parametrize_with_cases(
@@ -463,7 +501,7 @@ class TestOperationTrait:
     def test_operation_trait_serialization(
         self,
         trait: OperationTrait,
-        expected: dict,
+        expected: Mapping[str, Any],
     ) -> None:
         """Test OperationTrait serialization."""
         dumped = trait.model_dump()
@@ -473,18 +511,20 @@ class TestOperationTrait:
 class TestOperation:
     """Tests for Operation model."""
 
-    @parametrize_with_cases(
-        "yaml_data",
-        cases=[case_operation_basic, case_operation_full],
-    )
-    def test_operation_validation(self, yaml_data: str) -> None:
+    def test_operation_validation(self) -> None:
         """Test Operation model validation."""
-        data = yaml.safe_load(yaml_data)
-        operation = Operation.model_validate(data)
+        operation = OPERATION_ADAPTER.validate_python(case_operation_full())
         assert operation is not None
         assert operation.action in ["send", "receive"]
         assert operation.channel is not None
 
+    def test_operation_validation_batch(self) -> None:
+        """Test Operation validation of all cases in a single validate call."""
+        cases = [case_operation_basic(), case_operation_full()]
+        operations = OPERATION_LIST_ADAPTER.validate_python(cases)
+        assert [operation.action for operation in operations] == ["send", "send"]
+        assert all(operation.channel is not None for operation in operations)
+
     @parametrize_with_cases(
         "operation,expected",
         cases=[
@@ -495,7 +535,7 @@ class TestOperation:
         ],
     )
     def test_operation_serialization(
-        self, operation: Operation, expected: dict
+        self, operation: Operation, expected: Mapping[str, Any]
     ) -> None:
         """Test Operation serialization."""
         dumped = operation.model_dump()
@@ -513,13 +553,10 @@ class TestOperation:
           channel:
             $ref: '#/channels/userSignupReply'
         """
-        data = yaml.safe_load(yaml_data)
-        operation = Operation.model_validate(data)
+        data = load_yaml(yaml_data)
+        operation = OPERATION_ADAPTER.validate_python(data)
 
-        assert operation.reply is not None
-        assert isinstance(operation.reply, OperationReply)
-        assert operation.reply.address is not None
-        assert operation.reply.address.location == "$message.header#/replyTo"
+        assert operation.model_dump() == data
 
     def test_operation_with_messages_validation(self) -> None:
         """Test Operation with messages validation."""
@@ -530,15 +567,10 @@ class TestOperation:
         messages:
           - $ref: '#/channels/userSignup/messages/userSignedUp'
         """
-        data = yaml.safe_load(yaml_data)
-        operation = Operation.model_validate(data)
-
-        assert operation.messages is not None
-        assert len(operation.messages) == 1
-        assert isinstance(operation.messages[0], Reference)
-        assert (
-            operation.messages[0].ref == "#/channels/userSignup/messages/userSignedUp"
-        )
+        data = load_yaml(yaml_data)
+        operation = OPERATION_ADAPTER.validate_python(data)
+
+        assert operation.model_dump() == data
 
     def test_operation_with_traits_validation(self) -> None:
         """Test Operation with traits validation."""
@@ -549,32 +581,28 @@ class TestOperation:
         traits:
           - $ref: '#/components/operationTraits/kafka'
         """
-        data = yaml.safe_load(yaml_data)
-        operation = Operation.model_validate(data)
+        data = load_yaml(yaml_data)
+        operation = OPERATION_ADAPTER.validate_python(data)
 
-        assert operation.traits is not None
-        assert len(operation.traits) == 1
-        assert isinstance(operation.traits[0], Reference)
-        assert operation.traits[0].ref == "#/components/operationTraits/kafka"
+        assert operation.model_dump() == data
 
 
 class TestOperations:
     """Tests for Operations model."""
 
     @parametrize_with_cases(
-        "yaml_data",
+        "data",
         cases=[case_operations_basic, case_operations_with_references],
     )
-    def test_operations_validation(self, yaml_data: str) -> None:
+    def test_operations_validation(self, data: dict[str, Any]) -> None:
         """Test Operations model validation."""
-        data = yaml.safe_load(yaml_data)
         operations = Operations.model_validate(data["operations"])
         assert operations is not None
         assert isinstance(operations.root, dict)
         assert len(operations.root) > 0
 
     @parametrize_with_cases(
-        "yaml_data,expected_error",
+        "data,expected_error",
         cases=[
             case_operations_invalid_key_spaces,
             case_operations_invalid_key_special_chars,
@@ -582,10 +610,9 @@ class TestOperations:
         ],
     )
     def test_operations_validation_errors(
-        self, yaml_data: str, expected_error: str
+        self, data: dict[str, Any], expected_error: re.Pattern[str]
     ) -> None:
         """Test Operations validation errors for invalid field names."""
-        data = yaml.safe_load(yaml_data)
         with pytest.raises(ValueError, match=expected_error):
             Operations.model_validate(data["operations"])
 
@@ -596,58 +623,8 @@ class TestOperations:
         assert operations.root == {}
         assert len(operations.root) == 0
 
-    def test_operations_iteration(self) -> None:
-        """Test Operations __iter__ method."""
-        send_operation = Operation(
-            action="send", channel=Reference(ref="#/channels/userChannel")
-        )
-        receive_operation = Operation(
-            action="receive", channel=Reference(ref="#/channels/userChannel")
-        )
-
-        data: dict[str, Operation | Reference] = {
-            "sendUserSignup": send_operation,
-            "receiveUserSignup": receive_operation,
-        }
-        operations = Operations(root=data)
-
-        keys = list(operations)
-        assert len(keys) == 2
-        assert "sendUserSignup" in keys
-        assert "receiveUserSignup" in keys
-
-    def test_operations_getitem(self) -> None:
-        """Test Operations __getitem__ method."""
-        send_operation = Operation(
-            action="send", channel=Reference(ref="#/channels/userChannel")
-        )
-        receive_operation = Operation(
-            action="receive", channel=Reference(ref="#/channels/userChannel")
-        )
-
-        data: dict[str, Operation | Reference] = {
-            "sendUserSignup": send_operation,
-            "receiveUserSignup": receive_operation,
-        }
-        operations = Operations(root=data)
-
-        assert operations["sendUserSignup"] == send_operation
-        assert operations["receiveUserSignup"] == receive_operation
-
-    def test_operations_getattr(self) -> None:
-        """Test Operations __getitem__ method."""
-        send_operation = Operation(
-            action="send", channel=Reference(ref="#/channels/userChannel")
-        )
-        receive_operation = Operation(
-            action="receive", channel=Reference(ref="#/channels/userChannel")
-        )
-
-        data: dict[str, Operation | Reference] = {
-            "sendUserSignup": send_operation,
-            "receiveUserSignup": receive_operation,
-        }
-        operations = Operations(root=data)
-
-        assert operations["sendUserSignup"] == send_operation
-        assert operations["receiveUserSignup"] == receive_operation
+    def test_operations_access(self) -> None:
+        """Test Operations __iter__ and __getitem__ methods."""
+        assert list(OPERATIONS) == ["sendUserSignup", "receiveUserSignup"]
+        assert OPERATIONS["sendUserSignup"] == SEND_OPERATION
+        assert OPERATIONS["receiveUserSignup"] == RECEIVE_OPERATION
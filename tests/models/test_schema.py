@@ -1,61 +1,67 @@
 """Tests for schema models."""
 
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
 from typing import Any
 
-import yaml
-
-from pydantic import AnyUrl
+from pydantic import AnyUrl, TypeAdapter
 from pytest_cases import parametrize_with_cases
 
 from asyncapi3.models.base import ExternalDocumentation, Reference
 from asyncapi3.models.schema import MultiFormatSchema, Schema
+from tests.utils import load_yaml
+
+SCHEMA_ADAPTER = TypeAdapter(Schema)
+MULTI_FORMAT_SCHEMA_ADAPTER = TypeAdapter(MultiFormatSchema)
+
+EXAMPLE_URL = AnyUrl("https://example.com/")
 
 
 # Schema Validation Test Cases
-def case_schema_basic() -> str:
+def case_schema_basic() -> dict[str, Any]:
     """Schema with type only."""
-    return """
-    type: object
-    """
+    return {"type": "object"}
 
 
-def case_schema_full() -> str:
+def case_schema_full() -> dict[str, Any]:
     """Schema with multiple fields."""
-    return """
-    type: object
-    properties:
-      displayName:
-        type: string
-        description: Name of the user
-      email:
-        type: string
-        format: email
-        description: Email of the user
-    required:
-      - displayName
-      - email
-    discriminator: userType
-    deprecated: false
-    externalDocs:
-      description: Find more info here
-      url: https://example.com
-    """
+    return {
+        "type": "object",
+        "properties": {
+            "displayName": {"type": "string", "description": "Name of the user"},
+            "email": {
+                "type": "string",
+                "format": "email",
+                "description": "Email of the user",
+            },
+        },
+        "required": ["displayName", "email"],
+        "discriminator": "userType",
+        "deprecated": False,
+        "externalDocs": {
+            "description": "Find more info here",
+            "url": "https://example.com",
+        },
+    }
 
 
 # Schema Serialization Test Cases
-def case_schema_serialization_basic() -> tuple[Schema, dict]:
+@cache
+def case_schema_serialization_basic() -> tuple[Schema, Mapping[str, Any]]:
     """Schema serialization with type only."""
-    schema = Schema(type="object")
+    schema = Schema.model_construct(type="object")
     expected: dict[str, Any] = {"type": "object"}
-    return schema, expected
+    return schema, MappingProxyType(expected)
 
 
-def case_schema_serialization_with_discriminator() -> tuple[Schema, dict]:
+@cache
+def case_schema_serialization_with_discriminator() -> tuple[Schema, Mapping[str, Any]]:
     """Schema serialization with discriminator."""
-    schema = Schema(
+    schema = Schema.model_construct(
         type="object",
         discriminator="userType",
-        properties={"name": Schema(type="string")},
+        properties={"name": Schema.model_construct(type="string")},
     )
     expected: dict[str, Any] = {
         "type": "object",
@@ -66,33 +72,39 @@ def case_schema_serialization_with_discriminator() -> tuple[Schema, dict]:
             },
         },
     }
-    return schema, expected
+    return schema, MappingProxyType(expected)
 
 
-def case_schema_serialization_with_external_docs() -> tuple[Schema, dict]:
+@cache
+def case_schema_serialization_with_external_docs() -> tuple[Schema, Mapping[str, Any]]:
     """Schema serialization with externalDocs."""
-    schema = Schema(
+    schema = Schema.model_construct(
         type="object",
-        external_docs=ExternalDocumentation(
-            url="https://example.com",
+        external_docs=ExternalDocumentation.model_construct(
+            url=AnyUrl("https://example.com"),
             description="Find more info here",
         ),
     )
     expected: dict[str, Any] = {
         "type": "object",
         "externalDocs": {
-            "url": AnyUrl("https://example.com/"),
+            "url": EXAMPLE_URL,
             "description": "Find more info here",
         },
     }
-    return schema, expected
+    return schema, MappingProxyType(expected)
 
 
-def case_schema_serialization_with_reference_external_docs() -> tuple[Schema, dict]:
+@cache
+def case_schema_serialization_with_reference_external_docs() -> tuple[
+    Schema, Mapping[str, Any]
+]:
     """Schema serialization with externalDocs as Reference."""
-    schema = Schema(
+    schema = Schema.model_construct(
         type="object",
-        external_docs=Reference(ref="#/components/externalDocs/infoDocs"),
+        external_docs=Reference.model_construct(
+            ref="#/components/externalDocs/infoDocs"
+        ),
     )
     expected: dict[str, Any] = {
         "type": "object",
@@ -100,37 +112,33 @@ def case_schema_serialization_with_reference_external_docs() -> tuple[Schema, di
             "$ref": "#/components/externalDocs/infoDocs",
         },
     }
-    return schema, expected
+    return schema, MappingProxyType(expected)
 
 
 # MultiFormatSchema Validation Test Cases
-def case_multi_format_schema_basic() -> str:
+def case_multi_format_schema_basic() -> dict[str, Any]:
     """MultiFormatSchema with default schemaFormat."""
-    return """
-    schema:
-      type: object
-      properties:
-        name:
-          type: string
-    """
+    return {"schema": {"type": "object", "properties": {"name": {"type": "string"}}}}
 
 
-def case_multi_format_schema_avro() -> str:
+def case_multi_format_schema_avro() -> dict[str, Any]:
     """MultiFormatSchema with Avro format."""
-    return """
-    schemaFormat: 'application/vnd.apache.avro+yaml;version=1.9.0'
-    schema:
-      $ref: './user-create.avsc'
-    """
+    return {
+        "schemaFormat": "application/vnd.apache.avro+yaml;version=1.9.0",
+        "schema": {"$ref": "./user-create.avsc"},
+    }
 
 
 # MultiFormatSchema Serialization Test Cases
-def case_multi_format_schema_serialization_default() -> tuple[MultiFormatSchema, dict]:
+@cache
+def case_multi_format_schema_serialization_default() -> tuple[
+    MultiFormatSchema, Mapping[str, Any]
+]:
     """MultiFormatSchema serialization with default schemaFormat."""
-    multi_schema = MultiFormatSchema(
-        schema=Schema(
+    multi_schema = MultiFormatSchema.model_construct(
+        schema=Schema.model_construct(
             type="object",
-            properties={"name": Schema(type="string")},
+            properties={"name": Schema.model_construct(type="string")},
         ),
     )
     expected: dict[str, Any] = {
@@ -144,14 +152,17 @@ def case_multi_format_schema_serialization_default() -> tuple[MultiFormatSchema,
             },
         },
     }
-    return multi_schema, expected
+    return multi_schema, MappingProxyType(expected)
 
 
-def case_multi_format_schema_serialization_avro() -> tuple[MultiFormatSchema, dict]:
+@cache
+def case_multi_format_schema_serialization_avro() -> tuple[
+    MultiFormatSchema, Mapping[str, Any]
+]:
     """MultiFormatSchema serialization with Avro format."""
-    multi_schema = MultiFormatSchema(
+    multi_schema = MultiFormatSchema.model_construct(
         schema_format="application/vnd.apache.avro+yaml;version=1.9.0",
-        schema=Reference(ref="./user-create.avsc"),
+        schema=Reference.model_construct(ref="./user-create.avsc"),
     )
     expected: dict[str, Any] = {
         "schemaFormat": "application/vnd.apache.avro+yaml;version=1.9.0",
@@ -159,20 +170,19 @@ def case_multi_format_schema_serialization_avro() -> tuple[MultiFormatSchema, di
             "$ref": "./user-create.avsc",
         },
     }
-    return multi_schema, expected
+    return multi_schema, MappingProxyType(expected)
 
 
 class TestSchema:
     """Tests for Schema model."""
 
     @parametrize_with_cases(
-        "yaml_data",
+        "data",
         cases=[case_schema_basic, case_schema_full],
     )
-    def test_schema_validation(self, yaml_data: str) -> None:
+    def test_schema_validation(self, data: dict[str, Any]) -> None:
         """Test Schema model validation."""
-        data = yaml.safe_load(yaml_data)
-        schema = Schema.model_validate(data)
+        schema = SCHEMA_ADAPTER.validate_python(data)
         assert schema is not None
         if "type" in data:
             assert schema.type == data["type"]
@@ -186,7 +196,9 @@ class TestSchema:
             case_schema_serialization_with_reference_external_docs,
         ],
     )
-    def test_schema_serialization(self, schema: Schema, expected: dict) -> None:
+    def test_schema_serialization(
+        self, schema: Schema, expected: Mapping[str, Any]
+    ) -> None:
         """Test Schema serialization."""
         dumped = schema.model_dump()
         assert dumped == expected
@@ -200,8 +212,8 @@ class TestSchema:
           name:
             type: string
         """
-        data = yaml.safe_load(yaml_data)
-        schema = Schema.model_validate(data)
+        data = load_yaml(yaml_data)
+        schema = SCHEMA_ADAPTER.validate_python(data)
 
         assert schema.discriminator == "userType"
 
@@ -213,8 +225,8 @@ class TestSchema:
           description: Find more info here
           url: https://example.com
         """
-        data = yaml.safe_load(yaml_data)
-        schema = Schema.model_validate(data)
+        data = load_yaml(yaml_data)
+        schema = SCHEMA_ADAPTER.validate_python(data)
 
         assert schema.external_docs is not None
         assert str(schema.external_docs.url) == "https://example.com/"
@@ -226,25 +238,22 @@ class TestSchema:
         externalDocs:
           $ref: '#/components/externalDocs/infoDocs'
         """
-        data = yaml.safe_load(yaml_data)
-        schema = Schema.model_validate(data)
+        data = load_yaml(yaml_data)
+        schema = SCHEMA_ADAPTER.validate_python(data)
 
-        assert schema.external_docs is not None
-        assert isinstance(schema.external_docs, Reference)
-        assert schema.external_docs.ref == "#/components/externalDocs/infoDocs"
+        assert schema.model_dump() == data
 
 
 class TestMultiFormatSchema:
     """Tests for MultiFormatSchema model."""
 
     @parametrize_with_cases(
-        "yaml_data",
+        "data",
         cases=[case_multi_format_schema_basic, case_multi_format_schema_avro],
     )
-    def test_multi_format_schema_validation(self, yaml_data: str) -> None:
+    def test_multi_format_schema_validation(self, data: dict[str, Any]) -> None:
         """Test MultiFormatSchema model validation."""
-        data = yaml.safe_load(yaml_data)
-        multi_schema = MultiFormatSchema.model_validate(data)
+        multi_schema = MULTI_FORMAT_SCHEMA_ADAPTER.validate_python(data)
         assert multi_schema is not None
         assert multi_schema.schema is not None
 
@@ -258,7 +267,7 @@ class TestMultiFormatSchema:
     def test_multi_format_schema_serialization(
         self,
         multi_schema: MultiFormatSchema,
-        expected: dict,
+        expected: Mapping[str, Any],
     ) -> None:
         """Test MultiFormatSchema serialization."""
         dumped = multi_schema.model_dump()
@@ -273,8 +282,8 @@ class TestMultiFormatSchema:
             name:
               type: string
         """
-        data = yaml.safe_load(yaml_data)
-        multi_schema = MultiFormatSchema.model_validate(data)
+        data = load_yaml(yaml_data)
+        multi_schema = MULTI_FORMAT_SCHEMA_ADAPTER.validate_python(data)
 
         assert (
             multi_schema.schema_format == "application/vnd.aai.asyncapi;version=3.0.0"
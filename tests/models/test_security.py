@@ -1,11 +1,13 @@
 """Tests for security models."""
 
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
 from typing import Any
 
 import pytest
-import yaml
 
-from pydantic import AnyUrl
+from pydantic import AnyUrl, TypeAdapter
 from pytest_cases import parametrize_with_cases
 
 from asyncapi3.models.security import (
@@ -14,33 +16,59 @@ from asyncapi3.models.security import (
     OAuthFlows,
     SecurityScheme,
 )
+from tests.utils import load_yaml
+
+CORRELATION_ID_ADAPTER = TypeAdapter(CorrelationID)
+OAUTH_FLOW_ADAPTER = TypeAdapter(OAuthFlow)
+OAUTH_FLOWS_ADAPTER = TypeAdapter(OAuthFlows)
+SECURITY_SCHEME_ADAPTER = TypeAdapter(SecurityScheme)
+
+# Expected URLs and scopes shared by serialization cases
+AUTH_URL = AnyUrl("https://authserver.example/auth")
+TOKEN_URL = AnyUrl("https://authserver.example/token")
+REFRESH_URL = AnyUrl("https://authserver.example/refresh")
+SCOPES_ON = MappingProxyType({"streetlights:on": "Ability to switch lights on"})
+SCOPES_ON_OFF = MappingProxyType(
+    {
+        "streetlights:on": "Ability to switch lights on",
+        "streetlights:off": "Ability to switch lights off",
+    }
+)
+
+# Implicit flow shared by the OAuthFlows and SecurityScheme serialization cases
+IMPLICIT_FLOW = OAuthFlow(
+    authorization_url="https://authserver.example/auth", available_scopes=SCOPES_ON
+)
+IMPLICIT_FLOWS = OAuthFlows(implicit=IMPLICIT_FLOW)
 
 
 # CorrelationID Validation Test Cases
-def case_correlation_id_basic() -> str:
+def case_correlation_id_basic() -> dict[str, Any]:
     """CorrelationID with location only."""
-    return """
-    location: $message.header#/correlationId
-    """
+    return {"location": "$message.header#/correlationId"}
 
 
-def case_correlation_id_full() -> str:
+def case_correlation_id_full() -> dict[str, Any]:
     """CorrelationID with location and description."""
-    return """
-    description: Default Correlation ID
-    location: $message.header#/correlationId
-    """
+    return {
+        "description": "Default Correlation ID",
+        "location": "$message.header#/correlationId",
+    }
 
 
 # CorrelationID Serialization Test Cases
-def case_correlation_id_serialization_basic() -> tuple[CorrelationID, dict]:
+@cache
+def case_correlation_id_serialization_basic() -> tuple[
+    CorrelationID, Mapping[str, Any]
+]:
     """CorrelationID serialization with location only."""
     correlation_id = CorrelationID(location="$message.header#/correlationId")
     expected: dict[str, Any] = {"location": "$message.header#/correlationId"}
-    return correlation_id, expected
+    return correlation_id, MappingProxyType(expected)
 
 
-def case_correlation_id_serialization_full() -> tuple[CorrelationID, dict]:
+@cache
+def case_correlation_id_serialization_full() -> tuple[CorrelationID, Mapping[str, Any]]:
     """CorrelationID serialization with location and description."""
     correlation_id = CorrelationID(
         location="$message.header#/correlationId",
@@ -50,252 +78,224 @@ def case_correlation_id_serialization_full() -> tuple[CorrelationID, dict]:
         "location": "$message.header#/correlationId",
         "description": "Default Correlation ID",
     }
-    return correlation_id, expected
+    return correlation_id, MappingProxyType(expected)
 
 
 # OAuthFlow Validation Test Cases
-def case_oauth_flow_implicit() -> str:
+def case_oauth_flow_implicit() -> dict[str, Any]:
     """OAuthFlow implicit flow."""
-    return """
-    authorizationUrl: 'https://authserver.example/auth'
-    availableScopes:
-      'streetlights:on': Ability to switch lights on
-      'streetlights:off': Ability to switch lights off
-    """
+    return {
+        "authorizationUrl": "https://authserver.example/auth",
+        "availableScopes": {
+            "streetlights:on": "Ability to switch lights on",
+            "streetlights:off": "Ability to switch lights off",
+        },
+    }
 
 
-def case_oauth_flow_client_credentials() -> str:
+def case_oauth_flow_client_credentials() -> dict[str, Any]:
     """OAuthFlow clientCredentials flow."""
-    return """
-    tokenUrl: 'https://authserver.example/token'
-    availableScopes:
-      'streetlights:on': Ability to switch lights on
-      'streetlights:off': Ability to switch lights off
-    """
+    return {
+        "tokenUrl": "https://authserver.example/token",
+        "availableScopes": {
+            "streetlights:on": "Ability to switch lights on",
+            "streetlights:off": "Ability to switch lights off",
+        },
+    }
 
 
-def case_oauth_flow_authorization_code() -> str:
+def case_oauth_flow_authorization_code() -> dict[str, Any]:
     """OAuthFlow authorizationCode flow."""
-    return """
-    authorizationUrl: 'https://authserver.example/auth'
-    tokenUrl: 'https://authserver.example/token'
-    refreshUrl: 'https://authserver.example/refresh'
-    availableScopes:
-      'streetlights:on': Ability to switch lights on
-      'streetlights:off': Ability to switch lights off
-    """
+    return {
+        "authorizationUrl": "https://authserver.example/auth",
+        "tokenUrl": "https://authserver.example/token",
+        "refreshUrl": "https://authserver.example/refresh",
+        "availableScopes": {
+            "streetlights:on": "Ability to switch lights on",
+            "streetlights:off": "Ability to switch lights off",
+        },
+    }
 
 
 # OAuthFlow Serialization Test Cases
-def case_oauth_flow_serialization_implicit() -> tuple[OAuthFlow, dict]:
+@cache
+def case_oauth_flow_serialization_implicit() -> tuple[OAuthFlow, Mapping[str, Any]]:
     """OAuthFlow serialization implicit flow."""
     oauth_flow = OAuthFlow(
         authorization_url="https://authserver.example/auth",
-        available_scopes={
-            "streetlights:on": "Ability to switch lights on",
-            "streetlights:off": "Ability to switch lights off",
-        },
+        available_scopes=SCOPES_ON_OFF,
     )
     expected: dict[str, Any] = {
-        "authorizationUrl": AnyUrl("https://authserver.example/auth"),
-        "availableScopes": {
-            "streetlights:on": "Ability to switch lights on",
-            "streetlights:off": "Ability to switch lights off",
-        },
+        "authorizationUrl": AUTH_URL,
+        "availableScopes": SCOPES_ON_OFF,
     }
-    return oauth_flow, expected
+    return oauth_flow, MappingProxyType(expected)
 
 
-def case_oauth_flow_serialization_client_credentials() -> tuple[OAuthFlow, dict]:
+@cache
+def case_oauth_flow_serialization_client_credentials() -> tuple[
+    OAuthFlow, Mapping[str, Any]
+]:
     """OAuthFlow serialization clientCredentials flow."""
     oauth_flow = OAuthFlow(
         token_url="https://authserver.example/token",
-        available_scopes={
-            "streetlights:on": "Ability to switch lights on",
-            "streetlights:off": "Ability to switch lights off",
-        },
+        available_scopes=SCOPES_ON_OFF,
     )
     expected: dict[str, Any] = {
-        "tokenUrl": AnyUrl("https://authserver.example/token"),
-        "availableScopes": {
-            "streetlights:on": "Ability to switch lights on",
-            "streetlights:off": "Ability to switch lights off",
-        },
+        "tokenUrl": TOKEN_URL,
+        "availableScopes": SCOPES_ON_OFF,
     }
-    return oauth_flow, expected
+    return oauth_flow, MappingProxyType(expected)
 
 
-def case_oauth_flow_serialization_authorization_code() -> tuple[OAuthFlow, dict]:
+@cache
+def case_oauth_flow_serialization_authorization_code() -> tuple[
+    OAuthFlow, Mapping[str, Any]
+]:
     """OAuthFlow serialization authorizationCode flow."""
     oauth_flow = OAuthFlow(
         authorization_url="https://authserver.example/auth",
         token_url="https://authserver.example/token",
         refresh_url="https://authserver.example/refresh",
-        available_scopes={
-            "streetlights:on": "Ability to switch lights on",
-            "streetlights:off": "Ability to switch lights off",
-        },
+        available_scopes=SCOPES_ON_OFF,
     )
     expected: dict[str, Any] = {
-        "authorizationUrl": AnyUrl("https://authserver.example/auth"),
-        "tokenUrl": AnyUrl("https://authserver.example/token"),
-        "refreshUrl": AnyUrl("https://authserver.example/refresh"),
-        "availableScopes": {
-            "streetlights:on": "Ability to switch lights on",
-            "streetlights:off": "Ability to switch lights off",
-        },
+        "authorizationUrl": AUTH_URL,
+        "tokenUrl": TOKEN_URL,
+        "refreshUrl": REFRESH_URL,
+        "availableScopes": SCOPES_ON_OFF,
     }
-    return oauth_flow, expected
+    return oauth_flow, MappingProxyType(expected)
 
 
 # OAuthFlows Validation Test Cases
-def case_oauth_flows_basic() -> str:
+def case_oauth_flows_basic() -> dict[str, Any]:
     """OAuthFlows with implicit flow only."""
-    return """
-    implicit:
-      authorizationUrl: 'https://authserver.example/auth'
-      availableScopes:
-        'streetlights:on': Ability to switch lights on
-    """
+    return {
+        "implicit": {
+            "authorizationUrl": "https://authserver.example/auth",
+            "availableScopes": {"streetlights:on": "Ability to switch lights on"},
+        }
+    }
 
 
-def case_oauth_flows_full() -> str:
+def case_oauth_flows_full() -> dict[str, Any]:
     """OAuthFlows with all flows."""
-    return """
-    implicit:
-      authorizationUrl: 'https://authserver.example/auth'
-      availableScopes:
-        'streetlights:on': Ability to switch lights on
-    password:
-      tokenUrl: 'https://authserver.example/token'
-      availableScopes:
-        'streetlights:on': Ability to switch lights on
-    clientCredentials:
-      tokenUrl: 'https://authserver.example/token'
-      availableScopes:
-        'streetlights:on': Ability to switch lights on
-    authorizationCode:
-      authorizationUrl: 'https://authserver.example/auth'
-      tokenUrl: 'https://authserver.example/token'
-      availableScopes:
-        'streetlights:on': Ability to switch lights on
-    """
+    return {
+        "implicit": {
+            "authorizationUrl": "https://authserver.example/auth",
+            "availableScopes": {"streetlights:on": "Ability to switch lights on"},
+        },
+        "password": {
+            "tokenUrl": "https://authserver.example/token",
+            "availableScopes": {"streetlights:on": "Ability to switch lights on"},
+        },
+        "clientCredentials": {
+            "tokenUrl": "https://authserver.example/token",
+            "availableScopes": {"streetlights:on": "Ability to switch lights on"},
+        },
+        "authorizationCode": {
+            "authorizationUrl": "https://authserver.example/auth",
+            "tokenUrl": "https://authserver.example/token",
+            "availableScopes": {"streetlights:on": "Ability to switch lights on"},
+        },
+    }
 
 
 # OAuthFlows Serialization Test Cases
-def case_oauth_flows_serialization_empty() -> tuple[OAuthFlows, dict]:
+@cache
+def case_oauth_flows_serialization_empty() -> tuple[OAuthFlows, Mapping[str, Any]]:
     """OAuthFlows serialization empty."""
     oauth_flows = OAuthFlows()
     expected: dict[str, Any] = {}
-    return oauth_flows, expected
+    return oauth_flows, MappingProxyType(expected)
 
 
-def case_oauth_flows_serialization_basic() -> tuple[OAuthFlows, dict]:
+@cache
+def case_oauth_flows_serialization_basic() -> tuple[OAuthFlows, Mapping[str, Any]]:
     """OAuthFlows serialization with implicit flow only."""
-    oauth_flows = OAuthFlows(
-        implicit=OAuthFlow(
-            authorization_url="https://authserver.example/auth",
-            available_scopes={"streetlights:on": "Ability to switch lights on"},
-        ),
-    )
+    oauth_flows = IMPLICIT_FLOWS
     expected: dict[str, Any] = {
         "implicit": {
-            "authorizationUrl": AnyUrl("https://authserver.example/auth"),
-            "availableScopes": {
-                "streetlights:on": "Ability to switch lights on",
-            },
+            "authorizationUrl": AUTH_URL,
+            "availableScopes": SCOPES_ON,
         },
     }
-    return oauth_flows, expected
+    return oauth_flows, MappingProxyType(expected)
 
 
-def case_oauth_flows_serialization_full() -> tuple[OAuthFlows, dict]:
+@cache
+def case_oauth_flows_serialization_full() -> tuple[OAuthFlows, Mapping[str, Any]]:
     """OAuthFlows serialization with all flows."""
     oauth_flows = OAuthFlows(
-        implicit=OAuthFlow(
-            authorization_url="https://authserver.example/auth",
-            available_scopes={"streetlights:on": "Ability to switch lights on"},
-        ),
+        implicit=IMPLICIT_FLOW,
         password=OAuthFlow(
             token_url="https://authserver.example/token",
-            available_scopes={"streetlights:on": "Ability to switch lights on"},
+            available_scopes=SCOPES_ON,
         ),
         client_credentials=OAuthFlow(
             token_url="https://authserver.example/token",
-            available_scopes={"streetlights:on": "Ability to switch lights on"},
+            available_scopes=SCOPES_ON,
         ),
         authorization_code=OAuthFlow(
             authorization_url="https://authserver.example/auth",
             token_url="https://authserver.example/token",
-            available_scopes={"streetlights:on": "Ability to switch lights on"},
+            available_scopes=SCOPES_ON,
         ),
     )
     expected: dict[str, Any] = {
         "implicit": {
-            "authorizationUrl": AnyUrl("https://authserver.example/auth"),
-            "availableScopes": {
-                "streetlights:on": "Ability to switch lights on",
-            },
+            "authorizationUrl": AUTH_URL,
+            "availableScopes": SCOPES_ON,
         },
         "password": {
-            "tokenUrl": AnyUrl("https://authserver.example/token"),
-            "availableScopes": {
-                "streetlights:on": "Ability to switch lights on",
-            },
+            "tokenUrl": TOKEN_URL,
+            "availableScopes": SCOPES_ON,
         },
         "clientCredentials": {
-            "tokenUrl": AnyUrl("https://authserver.example/token"),
-            "availableScopes": {
-                "streetlights:on": "Ability to switch lights on",
-            },
+            "tokenUrl": TOKEN_URL,
+            "availableScopes": SCOPES_ON,
         },
         "authorizationCode": {
-            "authorizationUrl": AnyUrl("https://authserver.example/auth"),
-            "tokenUrl": AnyUrl("https://authserver.example/token"),
-            "availableScopes": {
-                "streetlights:on": "Ability to switch lights on",
-            },
+            "authorizationUrl": AUTH_URL,
+            "tokenUrl": TOKEN_URL,
+            "availableScopes": SCOPES_ON,
         },
     }
-    return oauth_flows, expected
+    return oauth_flows, MappingProxyType(expected)
 
 
 # SecurityScheme Validation Test Cases
-def case_security_scheme_http() -> str:
+def case_security_scheme_http() -> dict[str, Any]:
     """SecurityScheme http type."""
-    return """
-    type: http
-    scheme: bearer
-    bearerFormat: JWT
-    """
+    return {"type": "http", "scheme": "bearer", "bearerFormat": "JWT"}
 
 
-def case_security_scheme_oauth2() -> str:
+def case_security_scheme_oauth2() -> dict[str, Any]:
     """SecurityScheme oauth2 type."""
-    return """
-    type: oauth2
-    description: Flows to support OAuth 2.0
-    flows:
-      implicit:
-        authorizationUrl: 'https://authserver.example/auth'
-        availableScopes:
-          'streetlights:on': Ability to switch lights on
-    scopes:
-      - 'streetlights:on'
-    """
-
-
-def case_security_scheme_api_key() -> str:
+    return {
+        "type": "oauth2",
+        "description": "Flows to support OAuth 2.0",
+        "flows": {
+            "implicit": {
+                "authorizationUrl": "https://authserver.example/auth",
+                "availableScopes": {"streetlights:on": "Ability to switch lights on"},
+            }
+        },
+        "scopes": ["streetlights:on"],
+    }
+
+
+def case_security_scheme_api_key() -> dict[str, Any]:
     """SecurityScheme apiKey type."""
-    return """
-    type: apiKey
-    in: user
-    name: api_key
-    """
+    return {"type": "apiKey", "in": "user", "name": "api_key"}
 
 
 # SecurityScheme Serialization Test Cases
-def case_security_scheme_serialization_http() -> tuple[SecurityScheme, dict]:
+@cache
+def case_security_scheme_serialization_http() -> tuple[
+    SecurityScheme, Mapping[str, Any]
+]:
     """SecurityScheme serialization http type."""
     security_scheme = SecurityScheme(
         type_="http",
@@ -307,10 +307,13 @@ def case_security_scheme_serialization_http() -> tuple[SecurityScheme, dict]:
         "scheme": "bearer",
         "bearerFormat": "JWT",
     }
-    return security_scheme, expected
+    return security_scheme, MappingProxyType(expected)
 
 
-def case_security_scheme_serialization_api_key() -> tuple[SecurityScheme, dict]:
+@cache
+def case_security_scheme_serialization_api_key() -> tuple[
+    SecurityScheme, Mapping[str, Any]
+]:
     """SecurityScheme serialization apiKey type."""
     security_scheme = SecurityScheme(
         type_="apiKey",
@@ -322,20 +325,18 @@ def case_security_scheme_serialization_api_key() -> tuple[SecurityScheme, dict]:
         "in": "user",
         "name": "api_key",
     }
-    return security_scheme, expected
+    return security_scheme, MappingProxyType(expected)
 
 
-def case_security_scheme_serialization_oauth2() -> tuple[SecurityScheme, dict]:
+@cache
+def case_security_scheme_serialization_oauth2() -> tuple[
+    SecurityScheme, Mapping[str, Any]
+]:
     """SecurityScheme serialization oauth2 type."""
     security_scheme = SecurityScheme(
         type_="oauth2",
         description="Flows to support OAuth 2.0",
-        flows=OAuthFlows(
-            implicit=OAuthFlow(
-                authorization_url="https://authserver.example/auth",
-                available_scopes={"streetlights:on": "Ability to switch lights on"},
-            ),
-        ),
+        flows=IMPLICIT_FLOWS,
         scopes=["streetlights:on"],
     )
     expected: dict[str, Any] = {
@@ -343,220 +344,181 @@ def case_security_scheme_serialization_oauth2() -> tuple[SecurityScheme, dict]:
         "description": "Flows to support OAuth 2.0",
         "flows": {
             "implicit": {
-                "authorizationUrl": AnyUrl("https://authserver.example/auth"),
-                "availableScopes": {
-                    "streetlights:on": "Ability to switch lights on",
-                },
+                "authorizationUrl": AUTH_URL,
+                "availableScopes": SCOPES_ON,
             },
         },
         "scopes": ["streetlights:on"],
     }
-    return security_scheme, expected
+    return security_scheme, MappingProxyType(expected)
 
 
 # SecurityScheme Validation Error Test Cases
-def case_security_scheme_http_api_key_missing_name() -> tuple[str, str]:
+def case_security_scheme_http_api_key_missing_name() -> tuple[dict[str, Any], str]:
     """SecurityScheme httpApiKey missing name - should fail validation."""
-    yaml_data = """
-    type: httpApiKey
-    in: header
-    """
+    data: dict[str, Any] = {"type": "httpApiKey", "in": "header"}
     expected_error = "name is required for httpApiKey type"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_security_scheme_api_key_missing_in() -> tuple[str, str]:
+def case_security_scheme_api_key_missing_in() -> tuple[dict[str, Any], str]:
     """SecurityScheme apiKey missing in - should fail validation."""
-    yaml_data = """
-    type: apiKey
-    name: api_key
-    """
+    data: dict[str, Any] = {"type": "apiKey", "name": "api_key"}
     expected_error = "in is required for apiKey type"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_security_scheme_http_api_key_missing_in() -> tuple[str, str]:
+def case_security_scheme_http_api_key_missing_in() -> tuple[dict[str, Any], str]:
     """SecurityScheme httpApiKey missing in - should fail validation."""
-    yaml_data = """
-    type: httpApiKey
-    name: api_key
-    """
+    data: dict[str, Any] = {"type": "httpApiKey", "name": "api_key"}
     expected_error = "in is required for httpApiKey type"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_security_scheme_http_missing_scheme() -> tuple[str, str]:
+def case_security_scheme_http_missing_scheme() -> tuple[dict[str, Any], str]:
     """SecurityScheme http missing scheme - should fail validation."""
-    yaml_data = """
-    type: http
-    """
+    data: dict[str, Any] = {"type": "http"}
     expected_error = "scheme is required for http type"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_security_scheme_api_key_invalid_in() -> tuple[str, str]:
+def case_security_scheme_api_key_invalid_in() -> tuple[dict[str, Any], str]:
     """SecurityScheme apiKey with invalid in value - should fail validation."""
-    yaml_data = """
-    type: apiKey
-    in: header
-    name: api_key
-    """
+    data: dict[str, Any] = {"type": "apiKey", "in": "header", "name": "api_key"}
     expected_error = "in must be 'user' or 'password' for apiKey type"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_security_scheme_http_api_key_invalid_in() -> tuple[str, str]:
+def case_security_scheme_http_api_key_invalid_in() -> tuple[dict[str, Any], str]:
     """SecurityScheme httpApiKey with invalid in value - should fail validation."""
-    yaml_data = """
-    type: httpApiKey
-    in: user
-    name: api_key
-    """
+    data: dict[str, Any] = {"type": "httpApiKey", "in": "user", "name": "api_key"}
     expected_error = "in must be 'query', 'header', or 'cookie' for httpApiKey type"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_security_scheme_bearer_format_without_bearer_scheme() -> tuple[str, str]:
+def case_security_scheme_bearer_format_without_bearer_scheme() -> tuple[
+    dict[str, Any], str
+]:
     """SecurityScheme with bearerFormat but not bearer scheme - should fail validation."""
-    yaml_data = """
-    type: http
-    scheme: basic
-    bearerFormat: JWT
-    """
+    data: dict[str, Any] = {"type": "http", "scheme": "basic", "bearerFormat": "JWT"}
     expected_error = "bearerFormat can only be used with http type and bearer scheme"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_security_scheme_bearer_format_without_http_type() -> tuple[str, str]:
+def case_security_scheme_bearer_format_without_http_type() -> tuple[
+    dict[str, Any], str
+]:
     """SecurityScheme with bearerFormat but not http type - should fail validation."""
-    yaml_data = """
-    type: apiKey
-    in: user
-    name: api_key
-    bearerFormat: JWT
-    """
+    data: dict[str, Any] = {
+        "type": "apiKey",
+        "in": "user",
+        "name": "api_key",
+        "bearerFormat": "JWT",
+    }
     expected_error = "bearerFormat can only be used with http type and bearer scheme"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_security_scheme_oauth2_missing_flows() -> tuple[str, str]:
+def case_security_scheme_oauth2_missing_flows() -> tuple[dict[str, Any], str]:
     """SecurityScheme oauth2 missing flows - should fail validation."""
-    yaml_data = """
-    type: oauth2
-    """
+    data: dict[str, Any] = {"type": "oauth2"}
     expected_error = "flows is required for oauth2 type"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_security_scheme_openid_connect_missing_url() -> tuple[str, str]:
+def case_security_scheme_openid_connect_missing_url() -> tuple[dict[str, Any], str]:
     """SecurityScheme openIdConnect missing openIdConnectUrl - should fail validation."""
-    yaml_data = """
-    type: openIdConnect
-    """
+    data: dict[str, Any] = {"type": "openIdConnect"}
     expected_error = "openIdConnectUrl is required for openIdConnect type"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_security_scheme_scopes_with_wrong_type() -> tuple[str, str]:
+def case_security_scheme_scopes_with_wrong_type() -> tuple[dict[str, Any], str]:
     """SecurityScheme with scopes but wrong type - should fail validation."""
-    yaml_data = """
-    type: http
-    scheme: basic
-    scopes:
-      - read
-    """
+    data: dict[str, Any] = {"type": "http", "scheme": "basic", "scopes": ["read"]}
     expected_error = "scopes can only be used with oauth2 or openIdConnect type"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
 # OAuthFlows Validation Error Test Cases
-def case_oauth_flows_implicit_missing_authorization_url() -> tuple[str, str]:
+def case_oauth_flows_implicit_missing_authorization_url() -> tuple[dict[str, Any], str]:
     """OAuthFlows implicit flow missing authorizationUrl - should fail validation."""
-    yaml_data = """
-    implicit:
-      availableScopes:
-        'read': Read access
-    """
+    data: dict[str, Any] = {"implicit": {"availableScopes": {"read": "Read access"}}}
     expected_error = "authorizationUrl is required for implicit flow"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_oauth_flows_password_missing_token_url() -> tuple[str, str]:
+def case_oauth_flows_password_missing_token_url() -> tuple[dict[str, Any], str]:
     """OAuthFlows password flow missing tokenUrl - should fail validation."""
-    yaml_data = """
-    password:
-      availableScopes:
-        'read': Read access
-    """
+    data: dict[str, Any] = {"password": {"availableScopes": {"read": "Read access"}}}
     expected_error = "tokenUrl is required for password flow"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_oauth_flows_client_credentials_missing_token_url() -> tuple[str, str]:
+def case_oauth_flows_client_credentials_missing_token_url() -> tuple[
+    dict[str, Any], str
+]:
     """OAuthFlows clientCredentials flow missing tokenUrl - should fail validation."""
-    yaml_data = """
-    clientCredentials:
-      availableScopes:
-        'read': Read access
-    """
+    data: dict[str, Any] = {
+        "clientCredentials": {"availableScopes": {"read": "Read access"}}
+    }
     expected_error = "tokenUrl is required for clientCredentials flow"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_oauth_flows_authorization_code_missing_authorization_url() -> tuple[str, str]:
+def case_oauth_flows_authorization_code_missing_authorization_url() -> tuple[
+    dict[str, Any], str
+]:
     """OAuthFlows authorizationCode flow missing authorizationUrl - should fail validation."""
-    yaml_data = """
-    authorizationCode:
-      tokenUrl: 'https://authserver.example/token'
-      availableScopes:
-        'read': Read access
-    """
+    data: dict[str, Any] = {
+        "authorizationCode": {
+            "tokenUrl": "https://authserver.example/token",
+            "availableScopes": {"read": "Read access"},
+        }
+    }
     expected_error = "authorizationUrl is required for authorizationCode flow"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_oauth_flows_authorization_code_missing_token_url() -> tuple[str, str]:
+def case_oauth_flows_authorization_code_missing_token_url() -> tuple[
+    dict[str, Any], str
+]:
     """OAuthFlows authorizationCode flow missing tokenUrl - should fail validation."""
-    yaml_data = """
-    authorizationCode:
-      authorizationUrl: 'https://authserver.example/auth'
-      availableScopes:
-        'read': Read access
-    """
+    data: dict[str, Any] = {
+        "authorizationCode": {
+            "authorizationUrl": "https://authserver.example/auth",
+            "availableScopes": {"read": "Read access"},
+        }
+    }
     expected_error = "tokenUrl is required for authorizationCode flow"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
 # CorrelationID Validation Error Test Cases
-def case_correlation_id_invalid_location() -> tuple[str, str]:
+def case_correlation_id_invalid_location() -> tuple[dict[str, Any], str]:
     """CorrelationID with invalid location - should fail validation."""
-    yaml_data = """
-    location: invalid_location
-    """
+    data: dict[str, Any] = {"location": "invalid_location"}
     expected_error = "location must be a runtime expression starting with '\\$message.'"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
-def case_correlation_id_empty_location() -> tuple[str, str]:
+def case_correlation_id_empty_location() -> tuple[dict[str, Any], str]:
     """CorrelationID with empty location - should fail validation."""
-    yaml_data = """
-    location: ""
-    """
+    data: dict[str, Any] = {"location": ""}
     expected_error = "location must be a runtime expression starting with '\\$message.'"
-    return yaml_data, expected_error
+    return data, expected_error
 
 
 class TestCorrelationID:
     """Tests for CorrelationID model."""
 
     @parametrize_with_cases(
-        "yaml_data",
+        "data",
         cases=[case_correlation_id_basic, case_correlation_id_full],
     )
-    def test_correlation_id_validation(self, yaml_data: str) -> None:
+    def test_correlation_id_validation(self, data: dict[str, Any]) -> None:
         """Test CorrelationID model validation."""
-        data = yaml.safe_load(yaml_data)
-        correlation_id = CorrelationID.model_validate(data)
+        correlation_id = CORRELATION_ID_ADAPTER.validate_python(data)
         assert correlation_id is not None
         assert correlation_id.location == "$message.header#/correlationId"
 
@@ -570,33 +532,32 @@ class TestCorrelationID:
     def test_correlation_id_serialization(
         self,
         correlation_id: CorrelationID,
-        expected: dict,
+        expected: Mapping[str, Any],
     ) -> None:
         """Test CorrelationID serialization."""
-        dumped = correlation_id.model_dump()
+        dumped = CORRELATION_ID_ADAPTER.dump_python(correlation_id)
         assert dumped == expected
 
     @parametrize_with_cases(
-        "yaml_data,expected_error",
+        "data,expected_error",
         cases=[
             case_correlation_id_invalid_location,
             case_correlation_id_empty_location,
         ],
     )
     def test_correlation_id_validation_errors(
-        self, yaml_data: str, expected_error: str
+        self, data: dict[str, Any], expected_error: str
     ) -> None:
         """Test CorrelationID validation errors for invalid runtime expressions."""
-        data = yaml.safe_load(yaml_data)
         with pytest.raises(ValueError, match=expected_error):
-            CorrelationID.model_validate(data)
+            CORRELATION_ID_ADAPTER.validate_python(data)
 
 
 class TestSecuritySchemeValidationErrors:
     """Tests for SecurityScheme validation errors."""
 
     @parametrize_with_cases(
-        "yaml_data,expected_error",
+        "data,expected_error",
         cases=[
             case_security_scheme_http_api_key_missing_name,
             case_security_scheme_api_key_missing_in,
@@ -612,19 +573,18 @@ class TestSecuritySchemeValidationErrors:
         ],
     )
     def test_security_scheme_validation_errors(
-        self, yaml_data: str, expected_error: str
+        self, data: dict[str, Any], expected_error: str
     ) -> None:
         """Test SecurityScheme validation errors for invalid field combinations."""
-        data = yaml.safe_load(yaml_data)
         with pytest.raises(ValueError, match=expected_error):
-            SecurityScheme.model_validate(data)
+            SECURITY_SCHEME_ADAPTER.validate_python(data)
 
 
 class TestOAuthFlowsValidationErrors:
     """Tests for OAuthFlows validation errors."""
 
     @parametrize_with_cases(
-        "yaml_data,expected_error",
+        "data,expected_error",
         cases=[
             case_oauth_flows_implicit_missing_authorization_url,
             case_oauth_flows_password_missing_token_url,
@@ -634,29 +594,27 @@ class TestOAuthFlowsValidationErrors:
         ],
     )
     def test_oauth_flows_validation_errors(
-        self, yaml_data: str, expected_error: str
+        self, data: dict[str, Any], expected_error: str
     ) -> None:
         """Test OAuthFlows validation errors for invalid flow configurations."""
-        data = yaml.safe_load(yaml_data)
         with pytest.raises(ValueError, match=expected_error):
-            OAuthFlows.model_validate(data)
+            OAUTH_FLOWS_ADAPTER.validate_python(data)
 
 
 class TestOAuthFlow:
     """Tests for OAuthFlow model."""
 
     @parametrize_with_cases(
-        "yaml_data",
+        "data",
         cases=[
             case_oauth_flow_implicit,
             case_oauth_flow_client_credentials,
             case_oauth_flow_authorization_code,
         ],
     )
-    def test_oauth_flow_validation(self, yaml_data: str) -> None:
+    def test_oauth_flow_validation(self, data: dict[str, Any]) -> None:
         """Test OAuthFlow model validation."""
-        data = yaml.safe_load(yaml_data)
-        oauth_flow = OAuthFlow.model_validate(data)
+        oauth_flow = OAUTH_FLOW_ADAPTER.validate_python(data)
         assert oauth_flow is not None
         assert oauth_flow.available_scopes is not None
 
@@ -671,10 +629,10 @@ class TestOAuthFlow:
     def test_oauth_flow_serialization(
         self,
         oauth_flow: OAuthFlow,
-        expected: dict,
+        expected: Mapping[str, Any],
     ) -> None:
         """Test OAuthFlow serialization."""
-        dumped = oauth_flow.model_dump()
+        dumped = OAUTH_FLOW_ADAPTER.dump_python(oauth_flow)
         assert dumped == expected
 
 
@@ -682,13 +640,12 @@ class TestOAuthFlows:
     """Tests for OAuthFlows model."""
 
     @parametrize_with_cases(
-        "yaml_data",
+        "data",
         cases=[case_oauth_flows_basic, case_oauth_flows_full],
     )
-    def test_oauth_flows_validation(self, yaml_data: str) -> None:
+    def test_oauth_flows_validation(self, data: dict[str, Any]) -> None:
         """Test OAuthFlows model validation."""
-        data = yaml.safe_load(yaml_data)
-        oauth_flows = OAuthFlows.model_validate(data)
+        oauth_flows = OAUTH_FLOWS_ADAPTER.validate_python(data)
         assert oauth_flows is not None
         if "implicit" in data:
             assert oauth_flows.implicit is not None
@@ -704,10 +661,10 @@ class TestOAuthFlows:
     def test_oauth_flows_serialization(
         self,
         oauth_flows: OAuthFlows,
-        expected: dict,
+        expected: Mapping[str, Any],
     ) -> None:
         """Test OAuthFlows serialization."""
-        dumped = oauth_flows.model_dump()
+        dumped = OAUTH_FLOWS_ADAPTER.dump_python(oauth_flows)
         assert dumped == expected
 
 
@@ -715,17 +672,16 @@ class TestSecurityScheme:
     """Tests for SecurityScheme model."""
 
     @parametrize_with_cases(
-        "yaml_data",
+        "data",
         cases=[
             case_security_scheme_http,
             case_security_scheme_oauth2,
             case_security_scheme_api_key,
         ],
     )
-    def test_security_scheme_validation(self, yaml_data: str) -> None:
+    def test_security_scheme_validation(self, data: dict[str, Any]) -> None:
         """Test SecurityScheme model validation."""
-        data = yaml.safe_load(yaml_data)
-        security_scheme = SecurityScheme.model_validate(data)
+        security_scheme = SECURITY_SCHEME_ADAPTER.validate_python(data)
         assert security_scheme is not None
         assert security_scheme.type_ == data["type"]
 
@@ -740,10 +696,10 @@ class TestSecurityScheme:
     def test_security_scheme_serialization(
         self,
         security_scheme: SecurityScheme,
-        expected: dict,
+        expected: Mapping[str, Any],
     ) -> None:
         """Test SecurityScheme serialization."""
-        dumped = security_scheme.model_dump()
+        dumped = SECURITY_SCHEME_ADAPTER.dump_python(security_scheme)
         assert dumped == expected
 
     def test_security_scheme_oauth2_with_flows_validation(self) -> None:
@@ -759,8 +715,8 @@ class TestSecurityScheme:
         scopes:
           - 'streetlights:on'
         """
-        data = yaml.safe_load(yaml_data)
-        security_scheme = SecurityScheme.model_validate(data)
+        data = load_yaml(yaml_data)
+        security_scheme = SECURITY_SCHEME_ADAPTER.validate_python(data)
 
         assert security_scheme.type_ == "oauth2"
         assert security_scheme.flows is not None
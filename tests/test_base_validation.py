@@ -2,9 +2,9 @@ from itertools import chain
 from pathlib import Path
 
 import pytest
-import yaml
 
 from asyncapi3 import AsyncAPI3
+from tests.utils import load_yaml
 
 VALID_JSON_SPECS_FOLDER = "tests/fixtures/json_specs/valid"
 VALID_YAML_SPECS_FOLDER = "tests/fixtures/yaml_specs/valid/single_file"
@@ -39,5 +39,5 @@ def test_async_api3_parse_any_valid_json_spec(path: Path) -> None:
     ],
 )
 def test_async_api3_parse_any_valid_yaml_spec(path: Path) -> None:
-    spec = yaml.safe_load(path.read_text())
+    spec = load_yaml(path.read_text())
     assert AsyncAPI3.model_validate(spec) is not None
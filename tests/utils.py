@@ -0,0 +1,22 @@
+"""Shared helpers for asyncapi3 tests."""
+
+__all__ = ["load_yaml"]
+
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+def load_yaml(yaml_data: str) -> Any:
+    """
+    Parse YAML text with the libyaml-backed safe loader when it is available.
+
+    Drop-in replacement for yaml.safe_load: falls back to the pure-Python
+    SafeLoader on PyYAML builds without libyaml bindings.
+    """
+    return yaml.load(yaml_data, Loader=SafeLoader)